@@ -9,16 +9,57 @@ import cv2
 import mediapipe as mp
 import pyautogui
 import time
+import math
 import numpy as np
 import subprocess
+import threading
+import queue
+import collections
+from itertools import chain
+
+# Numba JIT for the per-frame numeric kernels; fall back to plain Python
+# if it is not installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+@njit(cache=True, fastmath=True)
+def _ear(eye):
+    """Eye Aspect Ratio kernel on a (6, 2) landmark slice"""
+    A = math.hypot(eye[1, 0] - eye[5, 0], eye[1, 1] - eye[5, 1])
+    B = math.hypot(eye[2, 0] - eye[4, 0], eye[2, 1] - eye[4, 1])
+    C = math.hypot(eye[0, 0] - eye[3, 0], eye[0, 1] - eye[3, 1])
+    return (A + B) / (2.0 * C)
+
+
+@njit(cache=True, fastmath=True)
+def _mar(mouth):
+    """Mouth Aspect Ratio kernel on a (12, 2) landmark slice"""
+    A = math.hypot(mouth[3, 0] - mouth[9, 0], mouth[3, 1] - mouth[9, 1])
+    B = math.hypot(mouth[2, 0] - mouth[10, 0], mouth[2, 1] - mouth[10, 1])
+    C = math.hypot(mouth[4, 0] - mouth[8, 0], mouth[4, 1] - mouth[8, 1])
+    D = math.hypot(mouth[0, 0] - mouth[6, 0], mouth[0, 1] - mouth[6, 1])
+    return (A + B + C) / (3.0 * D)
+
 
 class UnifiedFaceController:
     def __init__(self):
         # Initialize MediaPipe face mesh
         self.mp_face_mesh = mp.solutions.face_mesh
+        # refine_landmarks adds iris/lip refinement points we never index
+        # (all used indices are in the base 468-point set) but roughly
+        # doubles inference cost, so keep it off
         self.face_mesh = self.mp_face_mesh.FaceMesh(
+            static_image_mode=False,
             max_num_faces=1,
-            refine_landmarks=True,
+            refine_landmarks=False,
             min_detection_confidence=0.7,
             min_tracking_confidence=0.5
         )
@@ -30,13 +71,15 @@ class UnifiedFaceController:
         self.MOUSE_MODE = "mouse"
         self.current_mode = self.GESTURE_MODE
         self.last_mode_toggle = 0
-        self.mode_toggle_cooldown = 0.5
+        self.mode_toggle_cooldown_ns = 500_000_000
         
         # Screen dimensions for mouse mode
         self.screen_width, self.screen_height = pyautogui.size()
         
         # === GESTURE MODE VARIABLES ===
-        self.gesture_cooldown_time = 1.5
+        # Cooldowns are integer nanoseconds compared against a single
+        # time.monotonic_ns() read taken once per frame in run()
+        self.gesture_cooldown_ns = 1_500_000_000
         self.last_gesture_time = 0
         self.last_mouth_time = 0
         self.last_wide_eyes_time = 0
@@ -76,52 +119,107 @@ class UnifiedFaceController:
         # Mouse smoothing
         self.smoothed_x = None
         self.smoothed_y = None
+
+        # Precomputed nose->screen affine map (set once calibration completes)
+        self._ax = self._bx = self._ay = self._by = 0.0
+        self._x_min = self._x_max = 0.0
+        self._y_min = self._y_max = 0.0
         
         # Click gesture variables
         self.last_left_click = 0
         self.last_right_click = 0
-        self.click_cooldown = 0.8
-        
-        # Face landmark indices
-        self.LEFT_EYE_INDICES = [33, 160, 158, 133, 153, 144]
-        self.RIGHT_EYE_INDICES = [362, 385, 387, 263, 373, 380]
-        self.MOUTH_INDICES = [61, 84, 17, 314, 405, 320, 307, 375, 321, 308, 324, 318]
-        
-        # Enable pyautogui settings
+        self.click_cooldown_ns = 800_000_000
+        
+        # Face landmark indices (numpy arrays so detectors can fancy-index
+        # a single per-frame landmark array instead of looping in Python)
+        self.LEFT_EYE_INDICES = np.array([33, 160, 158, 133, 153, 144], dtype=np.intp)
+        self.RIGHT_EYE_INDICES = np.array([362, 385, 387, 263, 373, 380], dtype=np.intp)
+        self.MOUTH_INDICES = np.array([61, 84, 17, 314, 405, 320, 307, 375, 321, 308, 324, 318], dtype=np.intp)
+        
+        # Frame-skip governor: run MediaPipe on every Nth frame and reuse
+        # the previous result for display-only frames
+        self.infer_every = 2
+        self.frame_counter = 0
+        self.last_results = None
+
+        # Face mesh wireframe is debug-only: ~130 cv2.line calls per frame
+        # through mp_draw, so keep it off unless explicitly enabled
+        self.draw_mesh = False
+        self._contour_idx = np.array(
+            list(self.mp_face_mesh.FACEMESH_CONTOURS), dtype=np.intp)
+
+        # Debug HUD/overlay toggles; overlay drawing can be switched off at
+        # runtime ('o' key) or the preview window skipped entirely
+        self.show_overlay = True
+        self.show_window = True
+
+        # Cached HUD overlay: status text is re-rasterized only when the
+        # state it reflects changes, then composited onto each frame
+        self._hud_overlay = None
+        self._hud_mask = None
+        self._hud_state_key = None
+
+        # Gesture -> hotkey dispatch table: one pyautogui.hotkey call posts
+        # the whole key sequence instead of three keyDown/press/keyUp calls
+        self._gesture_actions = {
+            "head_left": ("🢠 EXECUTING: Head left - switching to previous desktop",
+                          ('ctrl', 'left')),
+            "head_right": ("🢢 EXECUTING: Head right - switching to next desktop",
+                           ('ctrl', 'right')),
+            "wide_eyes": ("👀 EXECUTING: Wide eyes - opening Mission Control",
+                          ('ctrl', 'up')),
+            # "mouth_open" intentionally absent - mouth is free for the voice agent
+        }
+
+        # Detector diagnostics go through a ring buffer drained by a
+        # background thread at 10Hz so the frame loop never blocks on stdout
+        self.verbose = True
+        self._log_q = collections.deque(maxlen=64)
+
+        # Actuator queues: pyautogui posts CGEvents that block, so cursor
+        # moves (most-recent-wins) and click/key actions run on dedicated
+        # threads instead of the frame loop
+        self._mouse_q = queue.Queue(maxsize=1)
+        self._action_q = queue.Queue()
+
+        # Enable pyautogui settings. PAUSE=0: the explicit gesture/click
+        # cooldowns already debounce, and a non-zero PAUSE sleeps after
+        # every moveTo, capping mouse mode at 1/PAUSE Hz
         pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.01
+        pyautogui.PAUSE = 0
     
+    def _landmarks_to_array(self, face_landmarks):
+        """Extract all face landmarks into a single (N, 2) float32 array"""
+        # Single pass over the protobuf repeated field with an exact count
+        # hint so fromiter fills a preallocated buffer instead of growing
+        landmarks = face_landmarks.landmark
+        n = len(landmarks)
+        return np.fromiter(
+            chain.from_iterable((lm.x, lm.y) for lm in landmarks),
+            dtype=np.float32, count=n * 2
+        ).reshape(n, 2)
+
     def calculate_eye_aspect_ratio(self, eye_landmarks):
         """Calculate Eye Aspect Ratio (EAR) for blink/wink detection"""
-        A = np.linalg.norm(eye_landmarks[1] - eye_landmarks[5])
-        B = np.linalg.norm(eye_landmarks[2] - eye_landmarks[4])
-        C = np.linalg.norm(eye_landmarks[0] - eye_landmarks[3])
-        ear = (A + B) / (2.0 * C)
-        return ear
-    
+        return _ear(eye_landmarks)
+
     def calculate_mouth_aspect_ratio(self, mouth_landmarks):
         """Calculate Mouth Aspect Ratio (MAR) for mouth opening detection"""
-        A = np.linalg.norm(mouth_landmarks[3] - mouth_landmarks[9])
-        B = np.linalg.norm(mouth_landmarks[2] - mouth_landmarks[10])
-        C = np.linalg.norm(mouth_landmarks[4] - mouth_landmarks[8])
-        D = np.linalg.norm(mouth_landmarks[0] - mouth_landmarks[6])
-        mar = (A + B + C) / (3.0 * D)
-        return mar
+        return _mar(mouth_landmarks)
     
     # === GESTURE MODE FUNCTIONS ===
-    def detect_head_gesture(self, face_landmarks):
+    def detect_head_gesture(self, pts, now_ns):
         """Detect head movements for desktop switching"""
         if self.current_mode != self.GESTURE_MODE:
             return None
-            
-        nose_x = face_landmarks.landmark[1].x
+
+        nose_x = float(pts[1, 0])
         
         if self.gesture_center_x is None:
             self.gesture_center_x = nose_x
             return None
         
         movement = nose_x - self.gesture_center_x
-        current_time = time.time()
         
         current_direction = None
         if abs(movement) > self.head_range:
@@ -129,11 +227,11 @@ class UnifiedFaceController:
         
         if abs(movement) < self.head_reset_range:
             if self.gesture_active:
-                print("🎯 Head returned to center - ready for next gesture")
+                self._log("🎯 Head returned to center - ready for next gesture")
             self.gesture_active = False
             self.last_gesture_direction = None
         
-        if current_time - self.last_gesture_time < self.gesture_cooldown_time:
+        if now_ns - self.last_gesture_time < self.gesture_cooldown_ns:
             return None
         
         if (current_direction is not None and 
@@ -142,7 +240,7 @@ class UnifiedFaceController:
             return None
         
         if current_direction is not None:
-            self.last_gesture_time = current_time
+            self.last_gesture_time = now_ns
             self.gesture_active = True
             self.last_gesture_direction = current_direction
             
@@ -153,158 +251,115 @@ class UnifiedFaceController:
         
         return None
     
-    def detect_mouth_gesture(self, face_landmarks):
+    def detect_mouth_gesture(self, pts, now_ns):
         """Detect mouth opening for Mission Control"""
         if self.current_mode != self.GESTURE_MODE:
             return None
-            
-        current_time = time.time()
-        if current_time - self.last_mouth_time < self.gesture_cooldown_time:
+
+        if now_ns - self.last_mouth_time < self.gesture_cooldown_ns:
             return None
-        
+
         # Skip if head is turned (prevents false triggers)
         if self.gesture_center_x is not None:
-            nose_x = face_landmarks.landmark[1].x
+            nose_x = float(pts[1, 0])
             head_movement = abs(nose_x - self.gesture_center_x)
             if head_movement > self.head_range * 0.7:
                 return None
-        
-        mouth_points = []
-        for idx in self.MOUTH_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            mouth_points.append([landmark.x, landmark.y])
-        mouth_points = np.array(mouth_points)
-        
+
+        mouth_points = pts[self.MOUTH_INDICES]
+
         mar = self.calculate_mouth_aspect_ratio(mouth_points)
         
         if self.baseline_mar is None:
             self.baseline_mar = mar
             self.mouth_calibration_frames += 1
             if self.mouth_calibration_frames >= self.mouth_calibration_needed:
-                print("✅ Mouth calibration complete!")
+                self._log("✅ Mouth calibration complete!")
             return None
         
         if self.mouth_calibration_frames < self.mouth_calibration_needed:
             self.baseline_mar = 0.9 * self.baseline_mar + 0.1 * mar
             self.mouth_calibration_frames += 1
             if self.mouth_calibration_frames >= self.mouth_calibration_needed:
-                print("✅ Mouth calibration complete!")
+                self._log("✅ Mouth calibration complete!")
             return None
         
         threshold = self.baseline_mar * self.mouth_open_multiplier
         mouth_ratio = mar / self.baseline_mar if self.baseline_mar > 0 else 0
         
         if mar > threshold and mouth_ratio > 1.4:
-            self.last_mouth_time = current_time
-            print(f"😮 MOUTH TRIGGERED! Opening Mission Control")
+            self.last_mouth_time = now_ns
+            self._log("😮 MOUTH TRIGGERED! Opening Mission Control")
             return "mouth_open"
         
         return None
     
-    def detect_wide_eyes_gesture(self, face_landmarks):
+    def detect_wide_eyes_gesture(self, now_ns, left_ear, right_ear):
         """Detect wide eyes for app switching"""
         if self.current_mode != self.GESTURE_MODE:
             return None
-            
-        current_time = time.time()
-        if current_time - self.last_wide_eyes_time < self.gesture_cooldown_time:
+
+        if now_ns - self.last_wide_eyes_time < self.gesture_cooldown_ns:
             return None
-        
-        left_eye_points = []
-        right_eye_points = []
-        
-        for idx in self.LEFT_EYE_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            left_eye_points.append([landmark.x, landmark.y])
-            
-        for idx in self.RIGHT_EYE_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            right_eye_points.append([landmark.x, landmark.y])
-        
-        left_eye_points = np.array(left_eye_points)
-        right_eye_points = np.array(right_eye_points)
-        
-        left_ear = self.calculate_eye_aspect_ratio(left_eye_points)
-        right_ear = self.calculate_eye_aspect_ratio(right_eye_points)
+
         avg_ear = (left_ear + right_ear) / 2.0
         
         if self.baseline_ear is None:
             self.baseline_ear = avg_ear
             self.wide_eyes_calibration_frames += 1
             if self.wide_eyes_calibration_frames >= self.wide_eyes_calibration_needed:
-                print("✅ Wide eyes calibration complete!")
+                self._log("✅ Wide eyes calibration complete!")
             return None
         
         if self.wide_eyes_calibration_frames < self.wide_eyes_calibration_needed:
             self.baseline_ear = 0.9 * self.baseline_ear + 0.1 * avg_ear
             self.wide_eyes_calibration_frames += 1
             if self.wide_eyes_calibration_frames >= self.wide_eyes_calibration_needed:
-                print("✅ Wide eyes calibration complete!")
+                self._log("✅ Wide eyes calibration complete!")
             return None
         
         threshold = self.baseline_ear * self.wide_eyes_multiplier
         eyes_ratio = avg_ear / self.baseline_ear if self.baseline_ear > 0 else 0
         
         if avg_ear > threshold and eyes_ratio > 1.25:
-            self.last_wide_eyes_time = current_time
-            print(f"👀 WIDE EYES! Switching applications")
+            self.last_wide_eyes_time = now_ns
+            self._log("👀 WIDE EYES! Switching applications")
             return "wide_eyes"
         
         return None
     
     # === MOUSE MODE FUNCTIONS ===
-    def detect_wink(self, face_landmarks):
+    def detect_wink(self, now_ns, left_ear, right_ear, head_rotation):
         """Detect winks for mouse clicking and mode toggling"""
-        current_time = time.time()
-        
-        # Check head pose to filter out false winks during head turns
-        nose_x = face_landmarks.landmark[1].x  # Nose tip
-        left_eye_center_x = face_landmarks.landmark[33].x  # Left eye center
-        right_eye_center_x = face_landmarks.landmark[362].x  # Right eye center
-        
-        # Calculate head rotation based on eye positions relative to nose
-        eye_center_x = (left_eye_center_x + right_eye_center_x) / 2
-        head_rotation = abs(nose_x - eye_center_x)
-        
+        # Cheap cooldown gates first: skip the wink logic when no action
+        # could fire anyway (the common case on most frames)
+        toggle_ready = now_ns - self.last_right_click > self.click_cooldown_ns
+        click_ready = (self.current_mode == self.MOUSE_MODE and
+                       now_ns - self.last_left_click > self.click_cooldown_ns)
+        if not toggle_ready and not click_ready:
+            return None
+
         # If head is turned too much, don't detect winks (prevents false triggers)
         head_turn_threshold = 0.02  # Adjust this value as needed
         if head_rotation > head_turn_threshold:
             return None
         
-        left_eye_points = []
-        right_eye_points = []
-        
-        for idx in self.LEFT_EYE_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            left_eye_points.append([landmark.x, landmark.y])
-            
-        for idx in self.RIGHT_EYE_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            right_eye_points.append([landmark.x, landmark.y])
-        
-        left_eye_points = np.array(left_eye_points)
-        right_eye_points = np.array(right_eye_points)
-        
-        left_ear = self.calculate_eye_aspect_ratio(left_eye_points)
-        right_ear = self.calculate_eye_aspect_ratio(right_eye_points)
-        
         # More lenient thresholds for better detection
         wink_threshold = 0.28
         ear_difference_threshold = 0.12
         
         # Left wink = toggle mode (works in both modes)
-        if (left_ear < wink_threshold and right_ear > wink_threshold + ear_difference_threshold and
-            current_time - self.last_right_click > self.click_cooldown):
-            self.last_right_click = current_time
-            print(f"🖁 LEFT WINK DETECTED! EAR values: left={left_ear:.3f}, right={right_ear:.3f}, head_rot={head_rotation:.3f}")
+        if (toggle_ready and
+            left_ear < wink_threshold and right_ear > wink_threshold + ear_difference_threshold):
+            self.last_right_click = now_ns
+            self._log(f"🖁 LEFT WINK DETECTED! EAR values: left={left_ear:.3f}, right={right_ear:.3f}, head_rot={head_rotation:.3f}")
             return "mode_toggle"
         
         # Right wink = left click (only in mouse mode)
-        if (self.current_mode == self.MOUSE_MODE and 
-            right_ear < wink_threshold and left_ear > wink_threshold + ear_difference_threshold and
-            current_time - self.last_left_click > self.click_cooldown):
-            self.last_left_click = current_time
-            print(f"🖁 RIGHT WINK DETECTED! EAR values: left={left_ear:.3f}, right={right_ear:.3f}, head_rot={head_rotation:.3f}")
+        if (click_ready and
+            right_ear < wink_threshold and left_ear > wink_threshold + ear_difference_threshold):
+            self.last_left_click = now_ns
+            self._log(f"🖁 RIGHT WINK DETECTED! EAR values: left={left_ear:.3f}, right={right_ear:.3f}, head_rot={head_rotation:.3f}")
             return "left_click"
         
         return None
@@ -322,81 +377,82 @@ class UnifiedFaceController:
             self.mouse_calibration_frames += 1
             if self.mouse_calibration_frames >= self.mouse_calibration_needed:
                 self.mouse_is_calibrated = True
-                print("✅ Mouse calibration complete! Nose control active.")
+                self._recompute_affine()
+                self._log("✅ Mouse calibration complete! Nose control active.")
+
+    def _recompute_affine(self):
+        """Precompute the nose->screen affine map used on the mouse hot path"""
+        half_x = self.screen_width * self.mouse_sensitivity * 0.5
+        half_y = self.screen_height * self.mouse_sensitivity * 0.5
+        self._ax = half_x / self.face_box_width
+        self._ay = half_y / self.face_box_height
+        self._bx = self.screen_width * 0.5 - self._ax * self.mouse_center_x
+        self._by = self.screen_height * 0.5 - self._ay * self.mouse_center_y
+        # Screen clamp composed with the +/-1 face-box clamp
+        self._x_min = max(0.0, self.screen_width * 0.5 - half_x)
+        self._x_max = min(self.screen_width - 1.0, self.screen_width * 0.5 + half_x)
+        self._y_min = max(0.0, self.screen_height * 0.5 - half_y)
+        self._y_max = min(self.screen_height - 1.0, self.screen_height * 0.5 + half_y)
     
     def nose_to_mouse_coords(self, nose_x, nose_y):
         """Convert nose position to screen coordinates"""
         if not self.mouse_is_calibrated or self.mouse_center_x is None:
             return None, None
-        
-        rel_x = (nose_x - self.mouse_center_x) / self.face_box_width
-        rel_y = (nose_y - self.mouse_center_y) / self.face_box_height
-        
-        rel_x = max(-1.0, min(1.0, rel_x))
-        rel_y = max(-1.0, min(1.0, rel_y))
-        
-        screen_x = self.screen_width // 2 + (rel_x * self.screen_width * self.mouse_sensitivity // 2)
-        screen_y = self.screen_height // 2 + (rel_y * self.screen_height * self.mouse_sensitivity // 2)
-        
-        screen_x = max(0, min(self.screen_width - 1, screen_x))
-        screen_y = max(0, min(self.screen_height - 1, screen_y))
-        
+
+        # Hot path: two multiply-adds and clamps against precomputed bounds
+        screen_x = self._ax * nose_x + self._bx
+        screen_y = self._ay * nose_y + self._by
+
+        if screen_x < self._x_min:
+            screen_x = self._x_min
+        elif screen_x > self._x_max:
+            screen_x = self._x_max
+        if screen_y < self._y_min:
+            screen_y = self._y_min
+        elif screen_y > self._y_max:
+            screen_y = self._y_max
+
         return int(screen_x), int(screen_y)
     
     def smooth_mouse_movement(self, target_x, target_y):
         """Apply smoothing to mouse movement"""
-        if self.smoothed_x is None:
-            self.smoothed_x = target_x
-            self.smoothed_y = target_y
+        # Bind to locals: LOAD_FAST beats repeated LOAD_ATTR in this
+        # per-frame path
+        sx, sy = self.smoothed_x, self.smoothed_y
+        if sx is None:
+            sx, sy = target_x, target_y
         else:
-            self.smoothed_x = self.smoothed_x * (1 - self.smoothing_factor) + target_x * self.smoothing_factor
-            self.smoothed_y = self.smoothed_y * (1 - self.smoothing_factor) + target_y * self.smoothing_factor
-        
-        return int(self.smoothed_x), int(self.smoothed_y)
+            alpha = self.smoothing_factor
+            sx = sx * (1 - alpha) + target_x * alpha
+            sy = sy * (1 - alpha) + target_y * alpha
+
+        self.smoothed_x, self.smoothed_y = sx, sy
+        return int(sx), int(sy)
     
     # === EXECUTION FUNCTIONS ===
     def execute_gesture_action(self, gesture):
+        """Queue a desktop control gesture for the actuator thread"""
+        self._action_q.put(("gesture", gesture))
+
+    def execute_click(self, click_type):
+        """Queue a mouse click for the actuator thread"""
+        self._action_q.put(("click", click_type))
+
+    def _do_gesture_action(self, gesture):
         """Execute desktop control gestures"""
+        action = self._gesture_actions.get(gesture)
+        if action is None:
+            return
+        message, hotkey = action
         try:
-            if gesture == "head_left":
-                print("🢀 EXECUTING: Head left - switching to previous desktop")
-                pyautogui.keyDown('ctrl')
-                pyautogui.press('left')
-                pyautogui.keyUp('ctrl')
-                
-            elif gesture == "head_right":
-                print("🢂 EXECUTING: Head right - switching to next desktop")
-                pyautogui.keyDown('ctrl')
-                pyautogui.press('right')
-                pyautogui.keyUp('ctrl')
-                
-            elif gesture == "wide_eyes":
-                print("👀 EXECUTING: Wide eyes - opening Mission Control")
-                pyautogui.keyDown('ctrl')
-                pyautogui.press('up')
-                pyautogui.keyUp('ctrl')
-                
-            # elif gesture == "wide_eyes":
-            #     print("👀 EXECUTING: Wide eyes - switching applications")
-            #     try:
-            #         subprocess.run(['osascript', '-e', 'tell application "System Events" to keystroke tab using command down'])
-            #     except Exception as e:
-            #         pyautogui.keyDown('cmd')
-            #         pyautogui.press('tab')
-            #         pyautogui.keyUp('cmd')
-                
-            # elif gesture == "mouth_open":  # Commented out - mouth now free for voice agent
-            #     print("😮 EXECUTING: Mouth open - opening Mission Control")
-            #     pyautogui.keyDown('ctrl')
-            #     pyautogui.press('up')
-            #     pyautogui.keyUp('ctrl')
-                
+            print(message)
+            pyautogui.hotkey(*hotkey)
         except Exception as e:
             print(f"⚠️  Gesture execution error: {e}")
             pyautogui.keyUp('ctrl')
             pyautogui.keyUp('cmd')
-    
-    def execute_click(self, click_type):
+
+    def _do_click(self, click_type):
         """Execute mouse clicks"""
         try:
             if click_type == "left_click":
@@ -408,10 +464,9 @@ class UnifiedFaceController:
         except Exception as e:
             print(f"⚠️  Click error: {e}")
     
-    def toggle_mode(self):
+    def toggle_mode(self, now_ns):
         """Toggle between gesture and mouse modes"""
-        current_time = time.time()
-        if current_time - self.last_mode_toggle > self.mode_toggle_cooldown:
+        if now_ns - self.last_mode_toggle > self.mode_toggle_cooldown_ns:
             if self.current_mode == self.GESTURE_MODE:
                 self.current_mode = self.MOUSE_MODE
                 # Reset mouse calibration
@@ -430,7 +485,7 @@ class UnifiedFaceController:
                 print("   Head movements = desktop switching")
                 print("   Wide eyes = app switching, Mouth = Mission Control")
             
-            self.last_mode_toggle = current_time
+            self.last_mode_toggle = now_ns
     
     def reset_calibration(self):
         """Reset all calibrations"""
@@ -452,34 +507,10 @@ class UnifiedFaceController:
             self.smoothed_y = None
             print("🎯 Mouse calibration reset")
     
-    def draw_overlays(self, frame, frame_width, frame_height, face_landmarks):
+    def draw_overlays(self, frame, frame_width, frame_height, pts,
+                      left_ear, right_ear, head_rotation):
         """Draw mode-specific overlays"""
-        # Draw EAR values for debugging wink detection
-        left_eye_points = []
-        right_eye_points = []
-        
-        for idx in self.LEFT_EYE_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            left_eye_points.append([landmark.x, landmark.y])
-            
-        for idx in self.RIGHT_EYE_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            right_eye_points.append([landmark.x, landmark.y])
-        
-        left_eye_points = np.array(left_eye_points)
-        right_eye_points = np.array(right_eye_points)
-        
-        left_ear = self.calculate_eye_aspect_ratio(left_eye_points)
-        right_ear = self.calculate_eye_aspect_ratio(right_eye_points)
-        
-        # Calculate head rotation for debugging
-        nose_x = face_landmarks.landmark[1].x
-        left_eye_center_x = face_landmarks.landmark[33].x
-        right_eye_center_x = face_landmarks.landmark[362].x
-        eye_center_x = (left_eye_center_x + right_eye_center_x) / 2
-        head_rotation = abs(nose_x - eye_center_x)
-        
-        # Display debug values
+        # Display debug values (EAR/head rotation computed once in run())
         cv2.putText(frame, f"Left EAR: {left_ear:.3f}", (10, frame_height - 110), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
         cv2.putText(frame, f"Right EAR: {right_ear:.3f}", (10, frame_height - 80), 
@@ -491,7 +522,7 @@ class UnifiedFaceController:
             # Draw center indicator for gesture mode
             if self.gesture_center_x is not None:
                 center_pixel_x = int(self.gesture_center_x * frame_width)
-                nose_y = int(face_landmarks.landmark[1].y * frame_height)
+                nose_y = int(pts[1, 1] * frame_height)
                 cv2.circle(frame, (center_pixel_x, nose_y), 5, (0, 255, 0), -1)
                 cv2.putText(frame, "CENTER", (center_pixel_x - 30, nose_y - 10), 
                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
@@ -516,13 +547,188 @@ class UnifiedFaceController:
                 cv2.line(frame, (center_pixel_x, center_pixel_y - 10), 
                         (center_pixel_x, center_pixel_y + 10), (0, 255, 0), 2)
     
+    # === PIPELINE THREADS ===
+    def _capture_loop(self, cap, read_q, stop_event):
+        """Capture thread: read frames, flip, convert to RGB, feed the inference stage"""
+        rgb_bufs = [None] * 4
+        buf_idx = 0
+        read = cap.read
+        stop_requested = stop_event.is_set
+        while not stop_requested():
+            ret, frame = read()
+            if not ret:
+                stop_event.set()
+                break
+
+            # Flip frame horizontally for mirror effect
+            frame = cv2.flip(frame, 1)
+
+            # Convert BGR to RGB into a preallocated buffer. A small ring is
+            # enough: the queue holds at most two frames plus one in flight
+            # in the inference thread, so four buffers never alias
+            buf = rgb_bufs[buf_idx]
+            if buf is None or buf.shape != frame.shape:
+                buf = rgb_bufs[buf_idx] = np.empty_like(frame)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buf)
+            rgb_frame = buf
+            buf_idx = (buf_idx + 1) % len(rgb_bufs)
+
+            # Drop stale frame so we always hand the freshest one downstream
+            try:
+                read_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                read_q.put((frame, rgb_frame), timeout=0.1)
+            except queue.Full:
+                pass
+
+    def _inference_loop(self, read_q, process_q, stop_event):
+        """Inference thread: run MediaPipe face mesh on frames from the capture stage"""
+        stop_requested = stop_event.is_set
+        get_frame = read_q.get
+        process = self.face_mesh.process
+        while not stop_requested():
+            try:
+                frame, rgb_frame = get_frame(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # Gesture state changes slowly relative to camera framerate, so
+            # only run MediaPipe every Nth frame; skipped frames reuse the
+            # previous landmarks for rendering and cursor smoothing
+            if self.frame_counter % self.infer_every == 0 or self.last_results is None:
+                # Landmarks are normalized [0,1] coords, so inference can run on a
+                # downscaled copy while drawing still uses the full-resolution frame
+                small_rgb = cv2.resize(rgb_frame, (320, 240), interpolation=cv2.INTER_AREA)
+                self.last_results = process(small_rgb)
+            self.frame_counter += 1
+            results = self.last_results
+
+            try:
+                process_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                process_q.put((frame, results), timeout=0.1)
+            except queue.Full:
+                pass
+
+    def _log(self, msg):
+        """Queue a diagnostic message for the log drain thread"""
+        if self.verbose:
+            self._log_q.append(msg)
+
+    def _log_worker(self, stop_event):
+        """Drain queued diagnostics to stdout off the frame loop"""
+        while not stop_event.is_set():
+            while self._log_q:
+                print(self._log_q.popleft())
+            time.sleep(0.1)
+        while self._log_q:
+            print(self._log_q.popleft())
+
+    def _mouse_worker(self, stop_event):
+        """Actuator thread: apply the latest cursor target via pyautogui"""
+        while not stop_event.is_set():
+            try:
+                x, y = self._mouse_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                pyautogui.moveTo(x, y)
+            except:
+                pass
+
+    def _action_worker(self, stop_event):
+        """Actuator thread: run queued gesture/click actions off the frame loop"""
+        while not stop_event.is_set():
+            try:
+                kind, payload = self._action_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if kind == "gesture":
+                self._do_gesture_action(payload)
+            elif kind == "click":
+                self._do_click(payload)
+
+    def _draw_contours(self, frame, pts, frame_width, frame_height):
+        """Draw the FACEMESH_CONTOURS wireframe with one batched polylines call"""
+        px = (pts * np.array([frame_width, frame_height], dtype=np.float32)).astype(np.int32)
+        cv2.polylines(frame, px[self._contour_idx], False, (0, 255, 0), 1)
+
+    def _draw_hud(self, frame, frame_width, frame_height):
+        """Composite the cached status HUD onto the frame, rebuilding on state change"""
+        head_cal = self.gesture_center_x is not None
+        eyes_cal = self.baseline_ear is not None and self.wide_eyes_calibration_frames >= self.wide_eyes_calibration_needed
+
+        hud_state_key = (
+            self.current_mode, frame_width, frame_height, head_cal, eyes_cal,
+            self.wide_eyes_calibration_frames, self.mouse_is_calibrated,
+            self.mouse_calibration_frames,
+        )
+
+        if hud_state_key != self._hud_state_key:
+            overlay = np.zeros_like(frame)
+
+            mode_text = "MOUSE MODE" if self.current_mode == self.MOUSE_MODE else "GESTURE MODE"
+            mode_color = (0, 255, 255) if self.current_mode == self.MOUSE_MODE else (0, 255, 0)
+            cv2.putText(overlay, mode_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, mode_color, 2)
+
+            if self.current_mode == self.GESTURE_MODE:
+                # Gesture mode status
+                if not head_cal:
+                    cv2.putText(overlay, "Look straight ahead to calibrate head tracking",
+                               (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                elif not eyes_cal:
+                    progress = f"{self.wide_eyes_calibration_frames}/{self.wide_eyes_calibration_needed}"
+                    cv2.putText(overlay, f"Keep eyes normal to calibrate: {progress}",
+                               (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                else:
+                    cv2.putText(overlay, "Ready! Head=desktop | Eyes=Mission Control | Left wink=mouse mode",
+                               (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+
+            elif self.current_mode == self.MOUSE_MODE:
+                # Mouse mode status
+                if not self.mouse_is_calibrated:
+                    progress = f"{self.mouse_calibration_frames}/{self.mouse_calibration_needed}"
+                    cv2.putText(overlay, f"Keep head still to calibrate mouse center: {progress}",
+                               (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                else:
+                    cv2.putText(overlay, "Move nose=cursor | Right wink=click | Left wink=gesture mode",
+                               (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+
+            cv2.putText(overlay, "Press 'r'=recalibrate | 'q'=quit | Left wink=toggle mode",
+                       (10, frame_height - 140), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+
+            self._hud_overlay = overlay
+            self._hud_mask = cv2.cvtColor(overlay, cv2.COLOR_BGR2GRAY)
+            self._hud_state_key = hud_state_key
+
+        cv2.copyTo(self._hud_overlay, self._hud_mask, frame)
+
     def run(self):
         """Main application loop"""
-        cap = cv2.VideoCapture(0)
-        
+        # Explicit AVFoundation backend on macOS; the platform-default probe
+        # can land on a backend with a deep internal frame queue
+        cap = cv2.VideoCapture(0, cv2.CAP_AVFOUNDATION)
+        if not cap.isOpened():
+            cap = cv2.VideoCapture(0, cv2.CAP_ANY)
+
         if not cap.isOpened():
             print("Error: Could not open camera")
             return
+
+        # Single-frame driver buffer so cap.read() always decodes the
+        # freshest frame instead of draining a stale backlog
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Request a modest capture resolution - EAR/MAR thresholds work on
+        # normalized landmarks, so there is no accuracy reason to feed
+        # MediaPipe a 720p/1080p frame
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        cap.set(cv2.CAP_PROP_FPS, 30)
         
         print("🚀 Unified Face Control System Started!")
         print("🎮 Starting in GESTURE MODE")
@@ -530,6 +736,7 @@ class UnifiedFaceController:
         print("=== CONTROLS ===")
         print("- LEFT WINK: Toggle between Gesture Mode and Mouse Mode")
         print("- Press 'r' to reset calibration for current mode")
+        print("- Press 'o' to toggle the debug overlay")
         print("- Press 'q' to quit")
         print("- Press ESC to switch back to gesture mode (from any mode)")
         print("- Move mouse to top-left corner for emergency quit")
@@ -544,43 +751,66 @@ class UnifiedFaceController:
         print("- Right wink: Left click")
         print("- Left wink: Toggle back to Gesture Mode")
         print("-" * 70)
-        
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
+
+        # Three-stage pipeline: capture -> inference -> main (gestures + render).
+        # Bounded queues keep latency at max(stage) instead of the sum.
+        stop_event = threading.Event()
+        read_q = queue.Queue(maxsize=2)
+        process_q = queue.Queue(maxsize=2)
+
+        capture_thread = threading.Thread(
+            target=self._capture_loop, args=(cap, read_q, stop_event), daemon=True)
+        inference_thread = threading.Thread(
+            target=self._inference_loop, args=(read_q, process_q, stop_event), daemon=True)
+        log_thread = threading.Thread(
+            target=self._log_worker, args=(stop_event,), daemon=True)
+        mouse_thread = threading.Thread(
+            target=self._mouse_worker, args=(stop_event,), daemon=True)
+        action_thread = threading.Thread(
+            target=self._action_worker, args=(stop_event,), daemon=True)
+        capture_thread.start()
+        inference_thread.start()
+        mouse_thread.start()
+        action_thread.start()
+        log_thread.start()
+
+        while not stop_event.is_set():
+            try:
+                frame, results = process_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
             frame_height, frame_width, _ = frame.shape
-            
-            # Convert BGR to RGB for MediaPipe
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Process face detection
-            results = self.face_mesh.process(rgb_frame)
-            
+
+            # One clock read per frame shared by every cooldown check
+            now_ns = time.monotonic_ns()
+
             if results.multi_face_landmarks:
                 for face_landmarks in results.multi_face_landmarks:
-                    # Draw face landmarks (minimal)
-                    self.mp_draw.draw_landmarks(
-                        frame,
-                        face_landmarks,
-                        self.mp_face_mesh.FACEMESH_CONTOURS,
-                        landmark_drawing_spec=None,
-                        connection_drawing_spec=self.mp_drawing_styles.get_default_face_mesh_contours_style()
-                    )
-                    
+                    # Extract all landmarks once per frame; detectors index into this
+                    pts = self._landmarks_to_array(face_landmarks)
+
+                    # Draw face landmarks (debug only)
+                    if self.draw_mesh:
+                        self._draw_contours(frame, pts, frame_width, frame_height)
+
                     # Get nose position
-                    nose_x = face_landmarks.landmark[1].x
-                    nose_y = face_landmarks.landmark[1].y
-                    
+                    nose_x = float(pts[1, 0])
+                    nose_y = float(pts[1, 1])
+
+                    # Shared per-frame eye metrics: EAR and head rotation are
+                    # needed by wink + wide-eyes detection and the overlay, so
+                    # compute them once and thread them through
+                    left_ear = self.calculate_eye_aspect_ratio(pts[self.LEFT_EYE_INDICES])
+                    right_ear = self.calculate_eye_aspect_ratio(pts[self.RIGHT_EYE_INDICES])
+                    head_rotation = abs(nose_x - (float(pts[33, 0]) + float(pts[362, 0])) / 2)
+
                     if self.current_mode == self.GESTURE_MODE:
                         # === GESTURE MODE PROCESSING ===
-                        head_gesture = self.detect_head_gesture(face_landmarks)
-                        # mouth_gesture = self.detect_mouth_gesture(face_landmarks)  # Commented out - mouth free for voice
-                        wide_eyes_gesture = self.detect_wide_eyes_gesture(face_landmarks)
-                        wink = self.detect_wink(face_landmarks)
+                        head_gesture = self.detect_head_gesture(pts, now_ns)
+                        # mouth_gesture = self.detect_mouth_gesture(pts, now_ns)  # Commented out - mouth free for voice
+                        wide_eyes_gesture = self.detect_wide_eyes_gesture(now_ns, left_ear, right_ear)
+                        wink = self.detect_wink(now_ns, left_ear, right_ear, head_rotation)
                         
                         # Execute gestures
                         if head_gesture:
@@ -590,7 +820,7 @@ class UnifiedFaceController:
                         elif wide_eyes_gesture:
                             self.execute_gesture_action(wide_eyes_gesture)
                         elif wink == "mode_toggle":
-                            self.toggle_mode()
+                            self.toggle_mode(now_ns)
                     
                     elif self.current_mode == self.MOUSE_MODE:
                         # === MOUSE MODE PROCESSING ===
@@ -601,75 +831,58 @@ class UnifiedFaceController:
                             target_x, target_y = self.nose_to_mouse_coords(nose_x, nose_y)
                             if target_x is not None and target_y is not None:
                                 smooth_x, smooth_y = self.smooth_mouse_movement(target_x, target_y)
+                                # Most-recent-wins: drop a stale target, never block
+                                try:
+                                    self._mouse_q.get_nowait()
+                                except queue.Empty:
+                                    pass
                                 try:
-                                    pyautogui.moveTo(smooth_x, smooth_y)
-                                except:
+                                    self._mouse_q.put_nowait((smooth_x, smooth_y))
+                                except queue.Full:
                                     pass
                         
                         # Detect wink actions
-                        wink = self.detect_wink(face_landmarks)
+                        wink = self.detect_wink(now_ns, left_ear, right_ear, head_rotation)
                         if wink == "left_click":
                             self.execute_click(wink)
                         elif wink == "mode_toggle":
-                            self.toggle_mode()
+                            self.toggle_mode(now_ns)
                         # elif wink == "right_click":  # Commented out - left wink now toggles mode
                         #     self.execute_click(wink)
                     
                     # Draw mode-specific overlays
-                    self.draw_overlays(frame, frame_width, frame_height, face_landmarks)
+                    if self.show_overlay and self.show_window:
+                        self.draw_overlays(frame, frame_width, frame_height, pts,
+                                           left_ear, right_ear, head_rotation)
             
             # === STATUS DISPLAY ===
-            mode_text = f"🖱️  MOUSE MODE" if self.current_mode == self.MOUSE_MODE else f"👋 GESTURE MODE"
-            mode_color = (0, 255, 255) if self.current_mode == self.MOUSE_MODE else (0, 255, 0)
-            cv2.putText(frame, mode_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, mode_color, 2)
-            
-            if self.current_mode == self.GESTURE_MODE:
-                # Gesture mode status
-                head_cal = self.gesture_center_x is not None
-                # mouth_cal = self.baseline_mar is not None and self.mouth_calibration_frames >= self.mouth_calibration_needed  # Commented out
-                eyes_cal = self.baseline_ear is not None and self.wide_eyes_calibration_frames >= self.wide_eyes_calibration_needed
-                
-                if not head_cal:
-                    cv2.putText(frame, "Look straight ahead to calibrate head tracking", 
-                               (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-                elif not eyes_cal:
-                    progress = f"{self.wide_eyes_calibration_frames}/{self.wide_eyes_calibration_needed}"
-                    cv2.putText(frame, f"Keep eyes normal to calibrate: {progress}", 
-                               (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-                else:
-                    cv2.putText(frame, "✅ Ready! Head=desktop | Eyes=Mission Control | Left wink=mouse mode", 
-                               (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-            
-            elif self.current_mode == self.MOUSE_MODE:
-                # Mouse mode status
-                if not self.mouse_is_calibrated:
-                    progress = f"{self.mouse_calibration_frames}/{self.mouse_calibration_needed}"
-                    cv2.putText(frame, f"Keep head still to calibrate mouse center: {progress}", 
-                               (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-                else:
-                    cv2.putText(frame, "✅ Move nose=cursor | Right wink=click | Left wink=gesture mode", 
-                               (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-            
-            cv2.putText(frame, "Press 'r'=recalibrate | 'q'=quit | Left wink=toggle mode", 
-                       (10, frame_height - 140), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-            
-            # Display frame
-            cv2.imshow('Unified Face Control System', frame)
+            if self.show_window:
+                self._draw_hud(frame, frame_width, frame_height)
+                cv2.imshow('Unified Face Control System', frame)
             
             # Handle key presses
             key = cv2.waitKey(1) & 0xFF
             if key == ord('q'):
+                stop_event.set()
                 break
             # elif key == ord('m'):  # Commented out - left wink now toggles mode
             #     self.toggle_mode()
             elif key == ord('r'):
                 self.reset_calibration()
+            elif key == ord('o'):
+                self.show_overlay = not self.show_overlay
             elif key == 27:  # ESC key - always return to gesture mode
                 if self.current_mode == self.MOUSE_MODE:
                     self.current_mode = self.GESTURE_MODE
                     print("👋 Returned to GESTURE MODE")
         
         # Cleanup
+        stop_event.set()
+        capture_thread.join(timeout=1.0)
+        inference_thread.join(timeout=1.0)
+        mouse_thread.join(timeout=1.0)
+        action_thread.join(timeout=1.0)
+        log_thread.join(timeout=1.0)
         cap.release()
         cv2.destroyAllWindows()
         print("Unified Face Control System closed.")
@@ -7,27 +7,90 @@ Handles communication with the FastAPI backend for command execution.
 Author: AI Assistant
 """
 
+import time
+from functools import lru_cache
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from http_pool import get_http_session, close_http_session
+
 
 class BackendService:
     """Service for communicating with the backend API"""
-    
+
+    # How long a health verdict stays fresh before we probe /health again
+    HEALTH_TTL = 3.0
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _iso_now(second: int) -> str:
+        """ISO timestamp bucketed to the second, so error storms reuse one
+        formatted string instead of building a datetime per failure"""
+        return datetime.now().isoformat(timespec='seconds')
+
     def __init__(self, backend_url: str = "http://127.0.0.1:8000"):
         self.backend_url = backend_url
-    
+        self._health_cache = (0.0, False)  # (monotonic timestamp, healthy)
+
+        # Shared process-wide session so the backend and Gladia reuse one
+        # warm connection pool. Transient gateway errors are retried on
+        # the same keep-alive connection rather than bounced back to the
+        # user as a failed voice command; the retry adapter is mounted on
+        # the backend URL prefix only, so Gladia traffic keeps the pool's
+        # default behavior.
+        self.session = get_http_session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False
+        )
+        self.session.mount(
+            self.backend_url,
+            HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+        )
+
+    def close(self):
+        """Close the shared HTTP session and its pooled connections"""
+        close_http_session()
+
+    def _format_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert backend response format to frontend expected format"""
+        return {
+            "status": result.get("status", "success"),
+            "message": result.get("response", ""),
+            "agent_type": "conversation",
+            "execution_time": result.get("execution_time", 0.0),
+            "timestamp": result.get("timestamp", self._iso_now(int(time.time()))),
+            "audio_url": result.get("audio_url")
+        }
+
+    def _error_response(self, error_msg: str) -> Dict[str, Any]:
+        """Build the standard error payload"""
+        print(f"❌ {error_msg}")
+        return {
+            "status": "error",
+            "message": error_msg,
+            "agent_type": "error",
+            "execution_time": 0.0,
+            "timestamp": self._iso_now(int(time.time()))
+        }
+
     def execute_command(self, command: str, session_id: Optional[str] = None) -> Dict[str, Any]:
         """Send command to backend API"""
         try:
             payload = {
                 "message": command
             }
-            
+
             print(f"🚀 Sending to backend: {command}")
-            
-            response = requests.post(
+
+            response = self.session.post(
                 f"{self.backend_url}/message",
                 json=payload,
                 timeout=180
@@ -36,41 +99,26 @@ class BackendService:
             if response.status_code == 200:
                 result = response.json()
                 print(f"✅ Backend response: {result.get('response', '')}")
-                # Convert backend response format to frontend expected format
-                return {
-                    "status": result.get("status", "success"),
-                    "message": result.get("response", ""),
-                    "agent_type": "conversation",
-                    "execution_time": result.get("execution_time", 0.0),
-                    "timestamp": result.get("timestamp", datetime.now().isoformat()),
-                    "audio_url": result.get("audio_url")
-                }
+                # A successful command round-trip proves the backend is up
+                self._health_cache = (time.monotonic(), True)
+                return self._format_result(result)
             else:
-                error_msg = f"Backend error: HTTP {response.status_code}"
-                print(f"❌ {error_msg}")
-                return {
-                    "status": "error",
-                    "message": error_msg,
-                    "agent_type": "error",
-                    "execution_time": 0.0,
-                    "timestamp": datetime.now().isoformat()
-                }
-                
+                return self._error_response(f"Backend error: HTTP {response.status_code}")
+
         except requests.exceptions.RequestException as e:
-            error_msg = f"Connection error: {e}"
-            print(f"❌ {error_msg}")
-            return {
-                "status": "error", 
-                "message": error_msg,
-                "agent_type": "error",
-                "execution_time": 0.0,
-                "timestamp": datetime.now().isoformat()
-            }
+            return self._error_response(f"Connection error: {e}")
     
     def check_health(self) -> bool:
-        """Check if backend is healthy"""
+        """Check if backend is healthy (cached for HEALTH_TTL seconds)"""
+        checked_at, healthy = self._health_cache
+        if time.monotonic() - checked_at < self.HEALTH_TTL:
+            return healthy
+
         try:
-            response = requests.get(f"{self.backend_url}/health", timeout=5)
-            return response.status_code == 200
+            response = self.session.get(f"{self.backend_url}/health", timeout=5)
+            healthy = response.status_code == 200
         except:
-            return False
\ No newline at end of file
+            healthy = False
+
+        self._health_cache = (time.monotonic(), healthy)
+        return healthy
\ No newline at end of file
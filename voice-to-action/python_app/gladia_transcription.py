@@ -8,21 +8,75 @@ Provides a replacement for the Google Speech Recognition used in the current imp
 Author: AI Assistant
 """
 
+import os
 import json
 import asyncio
+import logging
 import threading
 import time
 from typing import Optional, Callable
 import websockets
-import requests
 import numpy as np
 import sounddevice as sd
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, Qt
+
+from http_pool import get_http_session
+
+# uvloop swaps the selector-based event loop for libuv; optional, and not
+# available on Windows
+try:
+    import sys
+    if sys.platform != 'win32':
+        import uvloop
+        uvloop.install()
+except ImportError:
+    pass
+
+# orjson parses Gladia's JSON frames several times faster than stdlib json;
+# fall back transparently when it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+# Module logger; stays silent unless the host application configures
+# logging, so the audio hot path never blocks on terminal writes
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Opt-in request/response tracing for session creation; resolved once at
+# import so the happy path pays a single truth test
+_GLADIA_DEBUG = os.environ.get("GLADIA_DEBUG") == "1"
 
 # Global configuration
 SAMPLE_RATE = 16000
 CHUNK_SIZE = 1280  # 80ms chunks at 16kHz
 
+# Minimum spacing between partial-transcript signal emits; the UI gains
+# nothing above ~12Hz and repaints dominate past that
+PARTIAL_MIN_INTERVAL = 0.08
+
+_GLADIA_LIVE_URL = 'https://api.gladia.io/v2/live'
+
+# Session config never varies at runtime, so serialize it once at import;
+# create_session passes the bytes straight through data=
+_GLADIA_CONFIG = {
+    "encoding": "wav/pcm",
+    "sample_rate": SAMPLE_RATE,
+    "bit_depth": 16,
+    "channels": 1,
+    "endpointing": 1.0,  # Wait 1 second of silence before processing (Gladia built-in VAD)
+    "realtime_processing": {
+        "words_accurate_timestamps": True
+    }
+}
+_GLADIA_CONFIG_JSON = _json_dumps(_GLADIA_CONFIG)
+
 
 class GladiaTranscription(QObject):
     """Real-time speech transcription using Gladia's WebSocket API"""
@@ -42,6 +96,21 @@ class GladiaTranscription(QObject):
         self.audio_stream = None
         self.loop = None
         self.transcription_thread = None
+
+        # Coalesce outbound audio: buffer this many chunks of int16 PCM and
+        # flush as one WS binary message (concatenated PCM is still PCM).
+        # Set flush_every = 1 to force per-chunk sends.
+        self.flush_every = 3
+        self._send_buffer = bytearray()
+        self._last_cb_log = 0.0  # rate-limits audio-callback logging
+
+        # Outbound audio queue drained by a single writer task on the
+        # loop; created once the loop exists
+        self._out_q = None
+        self._writer_task = None
+
+        # Throttle clock for coalescing partial-transcript emits
+        self._last_partial_emit = 0.0
         
         # Gladia handles endpointing natively via the 'endpointing' parameter
         
@@ -50,98 +119,107 @@ class GladiaTranscription(QObject):
         try:
             # Log API key info (without exposing the key)
             api_key_preview = f"{self.api_key[:8]}...{self.api_key[-4:]}" if len(self.api_key) > 12 else "SHORT_KEY"
-            print(f"🔑 Using Gladia API key: {api_key_preview}")
+            logger.info("🔑 Using Gladia API key: %s", api_key_preview)
             
             headers = {
                 'Content-Type': 'application/json',
                 'X-Gladia-Key': self.api_key,
             }
-            
-            # Configuration for real-time transcription
-            config = {
-                "encoding": "wav/pcm",
-                "sample_rate": SAMPLE_RATE,
-                "bit_depth": 16,
-                "channels": 1,
-                "endpointing": 1.0,  # Wait 1 second of silence before processing (Gladia built-in VAD)
-                "realtime_processing": {
-                    "words_accurate_timestamps": True
-                }
-            }
-            
-            print(f"🌐 Making request to Gladia API: https://api.gladia.io/v2/live")
-            print(f"📋 Request config: {config}")
-            
-            response = requests.post(
-                'https://api.gladia.io/v2/live',
+
+            if _GLADIA_DEBUG:
+                logger.debug("🌐 Making request to Gladia API: %s", _GLADIA_LIVE_URL)
+                logger.debug("📋 Request config: %s", _GLADIA_CONFIG)
+
+            # Shared pool keeps the TLS connection to api.gladia.io warm
+            # across session creations (e.g. after a rate-limit retry)
+            response = get_http_session().post(
+                _GLADIA_LIVE_URL,
                 headers=headers,
-                json=config,
+                data=_GLADIA_CONFIG_JSON,
                 timeout=10
             )
             
-            print(f"📡 Response status: {response.status_code}")
-            print(f"📋 Response headers: {dict(response.headers)}")
+            if _GLADIA_DEBUG:
+                logger.debug("📡 Response status: %s", response.status_code)
+                logger.debug("📋 Response headers: %s", response.headers)
             
             if response.status_code in [200, 201]:
                 result = response.json()
                 self.session_url = result.get('url')
-                print(f"✅ Gladia session created: {result.get('id')}")
-                print(f"🔗 WebSocket URL: {self.session_url}")
+                logger.info("✅ Gladia session created: %s", result.get('id'))
+                logger.debug("🔗 WebSocket URL: %s", self.session_url)
                 return True
             else:
                 # Log detailed error information
                 try:
                     error_details = response.json()
-                    print(f"❌ Gladia API error details: {error_details}")
+                    logger.error("❌ Gladia API error details: %s", error_details)
                 except:
-                    print(f"❌ Gladia API error (no JSON): {response.text}")
+                    logger.error("❌ Gladia API error (no JSON): %s", response.text)
                 
                 error_msg = f"Failed to create Gladia session: HTTP {response.status_code}"
-                print(f"❌ {error_msg}")
+                logger.error("❌ %s", error_msg)
                 
                 # Log specific 429 rate limit details
                 if response.status_code == 429:
                     retry_after = response.headers.get('Retry-After', 'Unknown')
                     rate_limit_reset = response.headers.get('X-RateLimit-Reset', 'Unknown')
                     rate_limit_remaining = response.headers.get('X-RateLimit-Remaining', 'Unknown')
-                    print(f"🚫 RATE LIMIT EXCEEDED:")
-                    print(f"   - Retry-After: {retry_after}")
-                    print(f"   - Rate Limit Reset: {rate_limit_reset}")
-                    print(f"   - Rate Limit Remaining: {rate_limit_remaining}")
-                    print(f"   - This could be due to:")
-                    print(f"     • Too many requests from this API key")
-                    print(f"     • API key quota exceeded")
-                    print(f"     • Different rate limits on different machines")
+                    logger.error(
+                        "🚫 RATE LIMIT EXCEEDED: Retry-After=%s, "
+                        "X-RateLimit-Reset=%s, X-RateLimit-Remaining=%s "
+                        "(too many requests, quota exceeded, or different "
+                        "limits on different machines)",
+                        retry_after, rate_limit_reset, rate_limit_remaining
+                    )
                 
                 self.error_occurred.emit(error_msg)
                 return False
                 
         except Exception as e:
             error_msg = f"Error creating Gladia session: {e}"
-            print(f"❌ {error_msg}")
-            print(f"🔍 Exception type: {type(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ %s", error_msg)
             self.error_occurred.emit(error_msg)
             return False
     
     async def connect_websocket(self):
         """Connect to the Gladia WebSocket"""
         try:
-            self.websocket = await websockets.connect(self.session_url)
-            print("✅ Connected to Gladia WebSocket")
+            # Audio frames are raw PCM, so compression only burns CPU;
+            # generous max_size/max_queue keep dense transcript bursts flowing
+            self.websocket = await websockets.connect(
+                self.session_url,
+                compression=None,
+                max_size=2**22,
+                max_queue=64,
+                ping_interval=20,
+                ping_timeout=20
+            )
+            logger.info("✅ Connected to Gladia WebSocket")
             return True
         except Exception as e:
             error_msg = f"Failed to connect to Gladia WebSocket: {e}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             self.error_occurred.emit(error_msg)
             return False
     
     async def listen_for_messages(self):
         """Listen for messages from Gladia WebSocket"""
+        # Bind hot names once; inside the loop these are LOAD_FAST instead
+        # of attribute lookups repeated for every inbound frame
+        loads = _json_loads
+        emit_final = self.transcription_result.emit
+        emit_partial = self.transcription_partial.emit
+        emit_error = self.error_occurred.emit
+        monotonic = time.monotonic
+
         try:
             async for message in self.websocket:
-                data = json.loads(message)
+                # Gladia only sends JSON text frames; skip anything binary
+                if isinstance(message, (bytes, bytearray)):
+                    continue
+
+                data = loads(message)
                 
                 if data.get('type') == 'transcript':
                     transcript_data = data.get('data', {})
@@ -151,51 +229,106 @@ class GladiaTranscription(QObject):
                     if text:
                         if transcript_data.get('is_final', False):
                             # Final transcription - Gladia's endpointing handles the delay
-                            print(f"🎤 GLADIA FINAL: '{text}'")
-                            self.transcription_result.emit(text)
+                            logger.debug("🎤 GLADIA FINAL: %r", text)
+                            emit_final(text)
                         else:
-                            # Partial transcription
-                            print(f"🎤 GLADIA PARTIAL: '{text}'")
-                            self.transcription_partial.emit(text)
+                            # Partial transcription — coalesce bursts so
+                            # the GUI sees at most ~12 updates/s; finals
+                            # always go through above
+                            now = monotonic()
+                            if now - self._last_partial_emit >= PARTIAL_MIN_INTERVAL:
+                                logger.debug("🎤 GLADIA PARTIAL: %r", text)
+                                emit_partial(text)
+                                self._last_partial_emit = now
                 
                 elif data.get('type') == 'error':
                     error_msg = data.get('message', 'Unknown Gladia error')
-                    print(f"❌ Gladia error: {error_msg}")
-                    self.error_occurred.emit(error_msg)
+                    logger.error("❌ Gladia error: %s", error_msg)
+                    emit_error(error_msg)
                     
         except websockets.exceptions.ConnectionClosed:
-            print("🔌 Gladia WebSocket connection closed")
+            logger.info("🔌 Gladia WebSocket connection closed")
         except Exception as e:
             error_msg = f"Error listening to Gladia messages: {e}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             self.error_occurred.emit(error_msg)
     
     def audio_callback(self, indata, frames, time, status):
         """Audio callback for sending data to Gladia"""
-        if status:
-            print(f"⚠️ Audio callback status: {status}")
-        
+        if status and self._cb_log_ready():
+            logger.warning("⚠️ Audio callback status: %s", status)
+
         if self.websocket and self.is_recording:
             try:
-                # Convert to the format expected by Gladia (16-bit PCM)
-                audio_data = (indata.flatten() * 32767).astype(np.int16)
-                
-                # Send audio data to Gladia WebSocket (run in event loop)
-                if self.loop and not self.loop.is_closed():
-                    asyncio.run_coroutine_threadsafe(
-                        self.send_audio_chunk(audio_data.tobytes()),
-                        self.loop
-                    )
+                # Resolve loop/queue once per callback; everything below
+                # runs on locals
+                loop = self.loop
+                out_q = self._out_q
+
+                # PortAudio already delivers int16 PCM (see InputStream
+                # dtype), so the samples go straight into the buffer with
+                # no float multiply, rounding pass or cast
+                buf = self._send_buffer
+                buf += indata.tobytes()
+                if len(buf) >= CHUNK_SIZE * 2 * self.flush_every:
+                    # Hand the filled buffer off as-is and start a fresh
+                    # one; websockets frames bytes-like objects without
+                    # copying when compression is off, so no bytes() pass
+                    self._send_buffer = bytearray()
+
+                    # Enqueue for the writer task; call_soon_threadsafe is
+                    # one callback on the loop instead of a Future + Task
+                    # per flush like run_coroutine_threadsafe
+                    if loop and not loop.is_closed() and out_q is not None:
+                        loop.call_soon_threadsafe(out_q.put_nowait, buf)
             except Exception as e:
-                print(f"⚠️ Error in audio callback: {e}")
+                if self._cb_log_ready():
+                    logger.warning("⚠️ Error in audio callback: %s", e)
+
+    def _cb_log_ready(self) -> bool:
+        """Allow at most one audio-callback log line per second so a
+        persistent fault can't turn the PortAudio thread into a logger"""
+        now = time.monotonic()
+        if now - self._last_cb_log >= 1.0:
+            self._last_cb_log = now
+            return True
+        return False
     
-    async def send_audio_chunk(self, audio_bytes: bytes):
-        """Send audio chunk to Gladia WebSocket"""
+    async def _writer_loop(self):
+        """Single long-lived task that drains the outbound audio queue and
+        writes to the WebSocket; a None sentinel shuts it down"""
+        get = self._out_q.get
+        get_nowait = self._out_q.get_nowait
         try:
-            if self.websocket:
-                await self.websocket.send(audio_bytes)
+            while True:
+                chunk = await get()
+                if chunk is None:
+                    break
+
+                # If sends fell behind the callback, drain what's queued
+                # (up to a cap) and ship it as one message — Gladia needs
+                # contiguous PCM in a single frame, and one join + one
+                # write beats a syscall per backlog entry
+                backlog = None
+                while backlog is None or len(backlog) < 8:
+                    try:
+                        extra = get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if extra is None:
+                        # Re-park the sentinel for the outer loop
+                        self._out_q.put_nowait(None)
+                        break
+                    if backlog is None:
+                        backlog = [chunk]
+                    backlog.append(extra)
+                if backlog is not None:
+                    chunk = b"".join(backlog)
+
+                if self.websocket:
+                    await self.websocket.send(chunk)
         except Exception as e:
-            print(f"⚠️ Error sending audio chunk: {e}")
+            logger.warning("⚠️ Error sending audio chunk: %s", e)
     
     def start_transcription(self, timeout: float = 30.0) -> str:
         """Start real-time transcription and return the result"""
@@ -207,7 +340,9 @@ class GladiaTranscription(QObject):
             self.final_result = text
             self.transcription_complete.set()
         
-        self.transcription_result.connect(on_final_result)
+        # Signals are emitted from the asyncio loop thread; an explicit
+        # queued connection skips AutoConnection's per-emit thread check
+        self.transcription_result.connect(on_final_result, Qt.QueuedConnection)
         
         # Start the transcription in a separate thread
         self.transcription_thread = threading.Thread(
@@ -226,7 +361,7 @@ class GladiaTranscription(QObject):
     def start_continuous_transcription(self):
         """Start continuous transcription (for wake word detection)"""
         if self.transcription_thread and self.transcription_thread.is_alive():
-            print("⚠️ Transcription already running")
+            logger.warning("⚠️ Transcription already running")
             return
             
         # Start the transcription in a separate thread
@@ -235,7 +370,7 @@ class GladiaTranscription(QObject):
             daemon=True
         )
         self.transcription_thread.start()
-        print("🎤 Continuous transcription started")
+        logger.info("🎤 Continuous transcription started")
     
     def _run_transcription_session(self):
         """Run the transcription session in an event loop"""
@@ -246,44 +381,60 @@ class GladiaTranscription(QObject):
         try:
             self.loop.run_until_complete(self._async_transcription_session())
         except Exception as e:
-            print(f"❌ Error in transcription session: {e}")
+            logger.error("❌ Error in transcription session: %s", e)
             self.error_occurred.emit(str(e))
         finally:
             self.loop.close()
     
+    def _preopen_audio_stream(self):
+        """Construct (but don't start) the PortAudio input stream; opening
+        the device takes tens to hundreds of ms and is independent of the
+        Gladia HTTPS session creation it overlaps with"""
+        return sd.InputStream(
+            samplerate=SAMPLE_RATE,
+            channels=1,
+            dtype='int16',
+            blocksize=CHUNK_SIZE,
+            callback=self.audio_callback
+        )
+
     async def _async_transcription_session(self):
         """Async transcription session"""
         try:
+            # Open the audio device in an executor while the session POST
+            # is in flight; cold-start latency drops by the shorter of the
+            # two waits
+            audio_open = asyncio.get_running_loop().run_in_executor(
+                None, self._preopen_audio_stream
+            )
+
             # Create session
             if not await self.create_session():
+                self.audio_stream = await audio_open  # cleanup() closes it
                 return
             
             # Connect WebSocket
             if not await self.connect_websocket():
+                self.audio_stream = await audio_open
                 return
             
-            # Start listening for messages
+            # Start listening for messages and the audio writer
+            self._out_q = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
             message_task = asyncio.create_task(self.listen_for_messages())
             
-            # Start audio recording
+            # Start audio recording on the pre-opened stream
+            self.audio_stream = await audio_open
             self.is_recording = True
             self.status_changed.emit("Recording...")
-            
-            self.audio_stream = sd.InputStream(
-                samplerate=SAMPLE_RATE,
-                channels=1,
-                dtype=np.float32,
-                blocksize=CHUNK_SIZE,
-                callback=self.audio_callback
-            )
-            
-            with self.audio_stream:
-                print("🎤 Gladia transcription started...")
-                await message_task
+            self.audio_stream.start()
+
+            logger.info("🎤 Gladia transcription started...")
+            await message_task
                 
         except Exception as e:
             error_msg = f"Error in async transcription session: {e}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             self.error_occurred.emit(error_msg)
         finally:
             await self.cleanup()
@@ -297,8 +448,22 @@ class GladiaTranscription(QObject):
     async def cleanup(self):
         """Clean up resources"""
         self.is_recording = False
-        
-        
+
+        # Flush any buffered audio, then stop the writer before the
+        # socket goes away
+        if self._out_q is not None:
+            if self._send_buffer:
+                self._out_q.put_nowait(self._send_buffer)
+                self._send_buffer = bytearray()
+            self._out_q.put_nowait(None)
+        if self._writer_task is not None:
+            try:
+                await asyncio.wait_for(self._writer_task, timeout=2)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._writer_task.cancel()
+            self._writer_task = None
+        self._out_q = None
+
         if self.audio_stream:
             self.audio_stream.stop()
             self.audio_stream.close()
@@ -308,7 +473,7 @@ class GladiaTranscription(QObject):
             await self.websocket.close()
             self.websocket = None
         
-        print("🧹 Gladia transcription cleanup complete")
+        logger.info("🧹 Gladia transcription cleanup complete")
 
 
 class GladiaTranscriptionService:
@@ -325,7 +490,7 @@ class GladiaTranscriptionService:
             result = self.transcriber.start_transcription(timeout)
             return result.strip() if result else ""
         except Exception as e:
-            print(f"❌ Gladia transcription error: {e}")
+            logger.error("❌ Gladia transcription error: %s", e)
             return ""
         finally:
             if self.transcriber:
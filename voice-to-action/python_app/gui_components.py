@@ -7,20 +7,218 @@ Modern custom GUI components for the Control Flow application.
 Author: AI Assistant
 """
 
-from PySide6.QtWidgets import QWidget, QLabel, QFrame, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, QSizePolicy
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property, QRect, Signal
+from PySide6.QtWidgets import QWidget, QLabel, QFrame, QVBoxLayout, QHBoxLayout, QTextEdit, QPlainTextEdit, QPushButton, QSizePolicy, QApplication
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property, QRect, QRectF, QTimer, Signal
 from PySide6.QtGui import QPainter, QBrush, QColor, QLinearGradient, QPen, QFont, QPainterPath, QPixmap
 
 
+class _AnimationPauseMixin:
+    """Pauses a widget's looping animations while it is hidden or the
+    application is inactive, so off-screen indicators stop burning CPU on
+    property ticks and repaints. Subclasses populate self._anims."""
+
+    _anims = ()
+
+    def _watch_application_state(self):
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_app_state_changed)
+
+    def _on_app_state_changed(self, state):
+        if state == Qt.ApplicationActive:
+            # Only resume if the widget is actually on screen; the app
+            # can become active while the window is still minimized, and
+            # the showEvent path resumes once it is visible again
+            if self.isVisible():
+                self._resume_animations()
+        else:
+            self._pause_animations()
+
+    def _pause_animations(self):
+        for anim in self._anims:
+            if anim.state() == QPropertyAnimation.Running:
+                anim.pause()
+
+    def _resume_animations(self):
+        for anim in self._anims:
+            if anim.state() == QPropertyAnimation.Paused:
+                anim.resume()
+
+    def hideEvent(self, event):
+        self._pause_animations()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        self._resume_animations()
+        super().showEvent(event)
+
+
+# Stylesheets are module-level constants so each widget instance hands Qt
+# the same interned string instead of rebuilding the literal per call
+_CARD_TITLE_QSS = """
+    QLabel#card-title {
+        font-size: 14px;
+        font-weight: 600;
+        color: #666666;
+        margin-bottom: 8px;
+    }
+"""
+
+_CARD_QSS = """
+    ModernCard {
+        background-color: #FFFFFF;
+        border: none;
+        border-radius: 16px;
+        margin: 4px;
+    }
+    ModernCard:hover {
+        background-color: #FAFAFA;
+    }
+"""
+
+_BTN_PRIMARY_QSS = """
+    ModernButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #007AFF, stop:1 #005FCC);
+        border: none;
+        border-radius: 22px;
+        color: white;
+        font-size: 14px;
+        font-weight: 600;
+        padding: 12px 24px;
+    }
+    ModernButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #0056D6, stop:1 #0042A3);
+    }
+    ModernButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #004BB5, stop:1 #003A8A);
+    }
+"""
+
+_BTN_SECONDARY_QSS = """
+    ModernButton {
+        background-color: #F5F5F7;
+        border: 1px solid #E5E5E7;
+        border-radius: 22px;
+        color: #1D1D1F;
+        font-size: 14px;
+        font-weight: 500;
+        padding: 12px 24px;
+    }
+    ModernButton:hover {
+        background-color: #EBEBED;
+        border-color: #D1D1D6;
+    }
+    ModernButton:pressed {
+        background-color: #E1E1E3;
+    }
+"""
+
+
+# Shared state colors, allocated once instead of per state switch.
+# QColor is value-typed; sharing is safe as long as nobody mutates these —
+# code that needs a mutable color copies via QColor(shared).
+_COLOR_GRAY = QColor(200, 200, 200)
+_COLOR_GRAY_INACTIVE = QColor(128, 128, 128)
+_COLOR_BLUE = QColor(74, 144, 226)
+_COLOR_PURPLE = QColor(147, 51, 234)
+_COLOR_GREEN = QColor(34, 197, 94)
+_COLOR_RED = QColor(239, 68, 68)
+
+# ActivityIndicator.set_state parameter table:
+# (color, scale_anim (start, end, ms) or None, opacity_anim or None,
+#  static_scale, static_opacity)
+_ACTIVITY_STATES = {
+    "idle": (_COLOR_GRAY, None, None, 0.6, 0.5),
+    "listening": (_COLOR_BLUE, (0.85, 1.05, 2500), None, None, 0.9),
+    "processing": (_COLOR_PURPLE, (0.7, 1.3, 800), (0.3, 1.0, 600), None, None),
+    "speaking": (_COLOR_GREEN, (0.9, 1.1, 500), None, None, 1.0),
+    "error": (_COLOR_RED, None, (0.2, 1.0, 300), 1.0, None),
+}
+
+# WhisperIcon.set_state parameter table:
+# (color, amplitude_start (None = keep current), amplitude_end, run_wave)
+_WHISPER_STATES = {
+    "user_speaking": (_COLOR_BLUE, 0.0, 1.0, True),
+    "agent_speaking": (_COLOR_GREEN, 0.0, 1.0, True),
+    "listening": (_COLOR_BLUE, None, 0.3, False),
+    "processing": (_COLOR_BLUE, None, 0.5, False),
+    "idle": (_COLOR_BLUE, None, 0.0, False),
+}
+
+
+# Pre-rendered sphere pixmaps keyed by (rgba, pixel size); the animated
+# indicators blit these instead of re-filling gradient ellipses per frame
+_sphere_pixmap_cache = {}
+
+
+def _make_sphere_pixmap(color: QColor, size: int, dpr: float) -> QPixmap:
+    """Render the glow + gradient circle + highlight for ActivityIndicator
+    once at full opacity; paintEvent scales and fades the cached pixmap"""
+    key = (color.rgba(), int(size * dpr))
+    pixmap = _sphere_pixmap_cache.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    pixmap = QPixmap(int(size * dpr), int(size * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    center = size // 2
+    radius = int(size * 32 / 90)
+
+    # Glow ring out to the pixmap edge
+    glow_radius = radius + 8
+    glow_color = QColor(color)
+    glow_color.setAlphaF(0.3)
+    glow_gradient = QLinearGradient(center - glow_radius, center - glow_radius,
+                                    center + glow_radius, center + glow_radius)
+    glow_gradient.setColorAt(0, glow_color)
+    glow_gradient.setColorAt(0.7, glow_color.darker(110))
+    glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
+    painter.setBrush(QBrush(glow_gradient))
+    painter.setPen(Qt.NoPen)
+    painter.drawEllipse(center - glow_radius, center - glow_radius,
+                        glow_radius * 2, glow_radius * 2)
+
+    # Main circle
+    gradient = QLinearGradient(center - radius, center - radius,
+                               center + radius, center + radius)
+    gradient.setColorAt(0, color.lighter(150))
+    gradient.setColorAt(0.5, color)
+    gradient.setColorAt(1, color.darker(130))
+    painter.setBrush(QBrush(gradient))
+    painter.drawEllipse(center - radius, center - radius, radius * 2, radius * 2)
+
+    # Highlight (interior to the main circle, AA unnecessary)
+    painter.setRenderHint(QPainter.Antialiasing, False)
+    highlight_radius = int(radius * 0.6)
+    painter.setBrush(QBrush(QColor(255, 255, 255, 100)))
+    painter.drawEllipse(center - highlight_radius + 3, center - highlight_radius + 3,
+                        highlight_radius * 2, highlight_radius * 2)
+    painter.end()
+
+    _sphere_pixmap_cache[key] = pixmap
+    return pixmap
+
+
 class ModernStatusIndicator(QWidget):
     """Modern status indicator with glow effect"""
     
-    def __init__(self, color: QColor = QColor(128, 128, 128)):
+    def __init__(self, color: QColor = _COLOR_GRAY_INACTIVE):
         super().__init__()
         self.color = color
         self.setFixedSize(16, 16)
         self._glow_radius = 0
-        
+
+        # Brushes are rebuilt only when the color changes, not per frame
+        self._highlight_brush = QBrush(QColor(255, 255, 255, 80))
+        self._rebuild_brushes()
+
         # Animation for pulsing effect
         self.glow_animation = QPropertyAnimation(self, b"glow_radius")
         self.glow_animation.setDuration(1500)
@@ -35,13 +233,36 @@ class ModernStatusIndicator(QWidget):
     
     @glow_radius.setter
     def glow_radius(self, value):
+        # The eased curve rounds to many consecutive equal ints; repainting
+        # those frames would be pure waste
+        if value == self._glow_radius:
+            return
         self._glow_radius = value
-        self.update()
+        # Invalidate only this widget's rect, not the whole parent chrome
+        self.update(self.rect())
     
+    def _rebuild_brushes(self):
+        """Precompute the gradient brushes for the current color; the pulse
+        animation repaints at ~60Hz and brush construction dominates the
+        cost of drawing such small primitives"""
+        gradient = QLinearGradient(0, 0, 16, 16)
+        gradient.setColorAt(0, self.color.lighter(120))
+        gradient.setColorAt(1, self.color.darker(110))
+        self._main_brush = QBrush(gradient)
+
+        # A solid fill at the averaged alpha replaces the old corner-to-
+        # corner linear gradient: the gradient was a poor stand-in for a
+        # radial glow anyway, and Qt's solid-fill path rasterizes much
+        # faster than per-pixel gradient interpolation
+        glow_color = QColor(self.color)
+        glow_color.setAlpha(25)
+        self._glow_brush = QBrush(glow_color)
+
     def set_color(self, color: QColor, animate: bool = True):
         """Change the indicator color with optional pulse animation"""
         self.color = color
-        if animate and color != QColor(128, 128, 128):  # Don't animate gray (inactive)
+        self._rebuild_brushes()
+        if animate and color != _COLOR_GRAY_INACTIVE:  # Don't animate gray (inactive)
             self.glow_animation.start()
         else:
             self.glow_animation.stop()
@@ -57,14 +278,7 @@ class ModernStatusIndicator(QWidget):
         
         # Draw glow effect
         if self._glow_radius > 0:
-            glow_gradient = QLinearGradient(0, 0, 16, 16)
-            glow_color = QColor(self.color)
-            glow_color.setAlpha(50)
-            glow_gradient.setColorAt(0, glow_color)
-            glow_color.setAlpha(0)
-            glow_gradient.setColorAt(1, glow_color)
-            
-            painter.setBrush(QBrush(glow_gradient))
+            painter.setBrush(self._glow_brush)
             painter.setPen(Qt.NoPen)
             painter.drawEllipse(center_x - radius - self._glow_radius//2, 
                               center_y - radius - self._glow_radius//2,
@@ -72,17 +286,14 @@ class ModernStatusIndicator(QWidget):
                               (radius + self._glow_radius) * 2)
         
         # Draw main circle with gradient
-        gradient = QLinearGradient(0, 0, 16, 16)
-        gradient.setColorAt(0, self.color.lighter(120))
-        gradient.setColorAt(1, self.color.darker(110))
-        
-        painter.setBrush(QBrush(gradient))
+        painter.setBrush(self._main_brush)
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(center_x - radius, center_y - radius, radius * 2, radius * 2)
         
-        # Add highlight
-        highlight = QColor(255, 255, 255, 80)
-        painter.setBrush(QBrush(highlight))
+        # Add highlight; it sits well inside the antialiased main circle,
+        # so AA on its edge is invisible and only doubles the pixel cost
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setBrush(self._highlight_brush)
         painter.drawEllipse(center_x - radius + 1, center_y - radius + 1, radius, radius)
 
 
@@ -104,31 +315,14 @@ class ModernCard(QFrame):
         if title:
             title_label = QLabel(title)
             title_label.setObjectName("card-title")
-            title_label.setStyleSheet("""
-                QLabel#card-title {
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: #666666;
-                    margin-bottom: 8px;
-                }
-            """)
+            title_label.setStyleSheet(_CARD_TITLE_QSS)
             layout.addWidget(title_label)
         
         self.content_layout = layout
     
     def apply_style(self):
         """Apply modern card styling"""
-        self.setStyleSheet("""
-            ModernCard {
-                background-color: #FFFFFF;
-                border: none;
-                border-radius: 16px;
-                margin: 4px;
-            }
-            ModernCard:hover {
-                background-color: #FAFAFA;
-            }
-        """)
+        self.setStyleSheet(_CARD_QSS)
         
         # Add subtle shadow effect using frame style
         self.setFrameShadow(QFrame.Raised)
@@ -156,46 +350,7 @@ class ModernButton(QWidget):
     
     def apply_style(self):
         """Apply modern button styling"""
-        if self.primary:
-            self.setStyleSheet("""
-                ModernButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #007AFF, stop:1 #005FCC);
-                    border: none;
-                    border-radius: 22px;
-                    color: white;
-                    font-size: 14px;
-                    font-weight: 600;
-                    padding: 12px 24px;
-                }
-                ModernButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #0056D6, stop:1 #0042A3);
-                }
-                ModernButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #004BB5, stop:1 #003A8A);
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                ModernButton {
-                    background-color: #F5F5F7;
-                    border: 1px solid #E5E5E7;
-                    border-radius: 22px;
-                    color: #1D1D1F;
-                    font-size: 14px;
-                    font-weight: 500;
-                    padding: 12px 24px;
-                }
-                ModernButton:hover {
-                    background-color: #EBEBED;
-                    border-color: #D1D1D6;
-                }
-                ModernButton:pressed {
-                    background-color: #E1E1E3;
-                }
-            """)
+        self.setStyleSheet(_BTN_PRIMARY_QSS if self.primary else _BTN_SECONDARY_QSS)
     
     def enterEvent(self, event):
         self.hovered = True
@@ -214,15 +369,16 @@ class ModernButton(QWidget):
         super().mouseReleaseEvent(event)
 
 
-class ActivityIndicator(QWidget):
+class ActivityIndicator(_AnimationPauseMixin, QWidget):
     """Large animated activity circle with breathing effect"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(90, 90)  # Perfect size like reference
-        self.color = QColor(128, 128, 128)  # Default gray
+        self._color = _COLOR_GRAY_INACTIVE  # Default gray
         self._scale = 1.0
         self._opacity = 1.0
+        self._current_state = None  # None forces the first set_state through
         
         # Breathing animation
         self.scale_animation = QPropertyAnimation(self, b"scale")
@@ -243,6 +399,10 @@ class ActivityIndicator(QWidget):
         # Color transition animation
         self.color_animation = QPropertyAnimation(self, b"color")
         self.color_animation.setDuration(1000)
+
+        self._anims = (self.scale_animation, self.opacity_animation,
+                       self.color_animation)
+        self._watch_application_state()
     
     @Property(float)
     def scale(self):
@@ -250,8 +410,10 @@ class ActivityIndicator(QWidget):
     
     @scale.setter
     def scale(self, value):
+        if abs(value - self._scale) < 1e-3:
+            return
         self._scale = value
-        self.update()
+        self.update(self.rect())
     
     @Property(float)
     def opacity(self):
@@ -259,8 +421,10 @@ class ActivityIndicator(QWidget):
     
     @opacity.setter  
     def opacity(self, value):
+        if abs(value - self._opacity) < 1e-3:
+            return
         self._opacity = value
-        self.update()
+        self.update(self.rect())
     
     @Property(QColor)
     def color(self):
@@ -268,115 +432,63 @@ class ActivityIndicator(QWidget):
     
     @color.setter
     def color(self, value):
+        if value.rgba() == self._color.rgba():
+            return
         self._color = value
-        self.update()
+        self.update(self.rect())
     
     def set_state(self, state: str):
         """Set the activity state with appropriate animation"""
+        # Upstream status polling re-asserts the same state frequently;
+        # restarting the animations would just reset their phase and
+        # trigger a repaint for nothing
+        if state == self._current_state:
+            return
+        self._current_state = state
+
         self.scale_animation.stop()
         self.opacity_animation.stop()
-        
-        if state == "idle":
-            # Gray, small, no animation
-            self._color = QColor(200, 200, 200)
-            self._scale = 0.6
-            self._opacity = 0.5
-            
-        elif state == "listening":
-            # Soft blue like reference, gentle breathing
-            self._color = QColor(74, 144, 226)  # Softer blue like reference
-            self.scale_animation.setStartValue(0.85)
-            self.scale_animation.setEndValue(1.05)
-            self.scale_animation.setDuration(2500)  # Slower, more gentle
-            self.scale_animation.start()
-            self._opacity = 0.9
-            
-        elif state == "processing":
-            # Purple, faster pulsing
-            self._color = QColor(147, 51, 234)  # Purple
-            self.scale_animation.setStartValue(0.7)
-            self.scale_animation.setEndValue(1.3)
-            self.scale_animation.setDuration(800)
-            self.scale_animation.start()
-            
-            self.opacity_animation.setStartValue(0.3)
-            self.opacity_animation.setEndValue(1.0)
-            self.opacity_animation.setDuration(600)
-            self.opacity_animation.start()
-            
-        elif state == "speaking":
-            # Green, rhythmic pulsing
-            self._color = QColor(34, 197, 94)  # Green
-            self.scale_animation.setStartValue(0.9)
-            self.scale_animation.setEndValue(1.1)
-            self.scale_animation.setDuration(500)
-            self.scale_animation.start()
-            self._opacity = 1.0
-            
-        elif state == "error":
-            # Red, quick flash
-            self._color = QColor(239, 68, 68)  # Red
-            self.opacity_animation.setStartValue(0.2)
-            self.opacity_animation.setEndValue(1.0)
-            self.opacity_animation.setDuration(300)
-            self.opacity_animation.start()
-            self._scale = 1.0
-        
+
+        cfg = _ACTIVITY_STATES.get(state)
+        if cfg is not None:
+            color, scale_anim, opacity_anim, static_scale, static_opacity = cfg
+            self._color = color
+
+            if scale_anim is not None:
+                start, end, duration = scale_anim
+                self.scale_animation.setStartValue(start)
+                self.scale_animation.setEndValue(end)
+                self.scale_animation.setDuration(duration)
+                self.scale_animation.start()
+            if opacity_anim is not None:
+                start, end, duration = opacity_anim
+                self.opacity_animation.setStartValue(start)
+                self.opacity_animation.setEndValue(end)
+                self.opacity_animation.setDuration(duration)
+                self.opacity_animation.start()
+            if static_scale is not None:
+                self._scale = static_scale
+            if static_opacity is not None:
+                self._opacity = static_opacity
+
         self.update()
     
     def paintEvent(self, event):
         """Custom paint event for the activity circle"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Calculate center and radius for perfect size
-        center_x, center_y = 45, 45
-        base_radius = 32
-        radius = int(base_radius * self._scale)
-        
-        # Create gradient for depth
-        gradient = QLinearGradient(center_x - radius, center_y - radius, 
-                                   center_x + radius, center_y + radius)
-        
-        # Apply opacity to color
-        color_with_opacity = QColor(self._color)
-        color_with_opacity.setAlphaF(self._opacity)
-        
-        gradient.setColorAt(0, color_with_opacity.lighter(150))
-        gradient.setColorAt(0.5, color_with_opacity)
-        gradient.setColorAt(1, color_with_opacity.darker(130))
-        
-        # Draw glow effect
-        glow_radius = radius + 8
-        glow_color = QColor(self._color)
-        glow_color.setAlphaF(self._opacity * 0.3)
-        
-        glow_gradient = QLinearGradient(center_x - glow_radius, center_y - glow_radius,
-                                        center_x + glow_radius, center_y + glow_radius)
-        glow_gradient.setColorAt(0, glow_color)
-        glow_gradient.setColorAt(0.7, glow_color.darker(110))
-        glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
-        
-        painter.setBrush(QBrush(glow_gradient))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(center_x - glow_radius, center_y - glow_radius,
-                           glow_radius * 2, glow_radius * 2)
-        
-        # Draw main circle
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(center_x - radius, center_y - radius,
-                           radius * 2, radius * 2)
-        
-        # Add highlight
-        highlight_radius = int(radius * 0.6)
-        highlight = QColor(255, 255, 255, int(100 * self._opacity))
-        painter.setBrush(QBrush(highlight))
-        painter.drawEllipse(center_x - highlight_radius + 3, center_y - highlight_radius + 3,
-                           highlight_radius * 2, highlight_radius * 2)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        # Blit the pre-rendered sphere scaled to the breathing size; the
+        # whole-frame opacity replaces the per-layer alpha math
+        pixmap = _make_sphere_pixmap(self._color, 90, self.devicePixelRatioF())
+        half = int(45 * self._scale)
+        target = QRect(45 - half, 45 - half, half * 2, half * 2)
+
+        painter.setOpacity(self._opacity)
+        painter.drawPixmap(target, pixmap)
 
 
-class WhisperIcon(QWidget):
+class WhisperIcon(_AnimationPauseMixin, QWidget):
     """Animated Whisper icon with speech wave animation"""
     
     def __init__(self, parent=None):
@@ -384,8 +496,8 @@ class WhisperIcon(QWidget):
         self.setFixedSize(40, 40)
         self._wave_amplitude = 0.0
         self._wave_phase = 0.0
-        self._base_color = QColor(74, 144, 226)  # Blue as default color
-        self._current_state = "idle"
+        self._base_color = _COLOR_BLUE  # Blue as default color
+        self._current_state = None  # None forces the first set_state through
         
         # Wave animation for speaking
         self.wave_animation = QPropertyAnimation(self, b"wave_phase")
@@ -398,6 +510,25 @@ class WhisperIcon(QWidget):
         self.amplitude_animation = QPropertyAnimation(self, b"wave_amplitude")
         self.amplitude_animation.setDuration(800)
         self.amplitude_animation.setEasingCurve(QEasingCurve.InOutSine)
+
+        self._anims = (self.wave_animation, self.amplitude_animation)
+        self._watch_application_state()
+
+        self._rebuild_paint_cache()
+
+    def _rebuild_paint_cache(self):
+        """Precompute the pens and brushes for the current base color; the
+        wave animation repaints continuously and per-frame QPen/QColor
+        construction is the bulk of its Python-side cost"""
+        gradient = QLinearGradient(0, 0, 40, 40)
+        gradient.setColorAt(0, self._base_color.lighter(120))
+        gradient.setColorAt(1, self._base_color.darker(110))
+        self._main_brush = QBrush(gradient)
+        self._highlight_brush = QBrush(QColor(255, 255, 255, 120))
+        # One pen and mutable color per wave ring; only alpha changes per frame
+        self._wave_colors = [QColor(self._base_color) for _ in range(3)]
+        self._wave_pens = [QPen(c, 2) for c in self._wave_colors]
+        self._cached_color_rgba = self._base_color.rgba()
     
     @Property(float)
     def wave_phase(self):
@@ -405,8 +536,10 @@ class WhisperIcon(QWidget):
     
     @wave_phase.setter
     def wave_phase(self, value):
+        if abs(value - self._wave_phase) < 1e-3:
+            return
         self._wave_phase = value
-        self.update()
+        self.update(self.rect())
     
     @Property(float)
     def wave_amplitude(self):
@@ -414,47 +547,31 @@ class WhisperIcon(QWidget):
     
     @wave_amplitude.setter
     def wave_amplitude(self, value):
+        if abs(value - self._wave_amplitude) < 1e-3:
+            return
         self._wave_amplitude = value
-        self.update()
+        self.update(self.rect())
     
     def set_state(self, state: str):
         """Set animation state (idle, listening, speaking, processing, user_speaking, agent_speaking)"""
+        if state == self._current_state:
+            return
         self._current_state = state
         self.wave_animation.stop()
         self.amplitude_animation.stop()
-        
-        if state == "user_speaking":
-            # Blue with strong animation for user speaking
-            self._base_color = QColor(74, 144, 226)  # Blue
-            self.amplitude_animation.setStartValue(0.0)
-            self.amplitude_animation.setEndValue(1.0)
-            self.amplitude_animation.start()
-            self.wave_animation.start()
-        elif state == "agent_speaking":
-            # Green with strong animation for agent speaking
-            self._base_color = QColor(34, 197, 94)  # Green
-            self.amplitude_animation.setStartValue(0.0)
-            self.amplitude_animation.setEndValue(1.0)
-            self.amplitude_animation.start()
+
+        color, amp_start, amp_end, run_wave = _WHISPER_STATES.get(
+            state, _WHISPER_STATES["idle"])
+        self._base_color = color
+        if color.rgba() != self._cached_color_rgba:
+            self._rebuild_paint_cache()
+        if amp_start is None:
+            amp_start = self._wave_amplitude
+        self.amplitude_animation.setStartValue(amp_start)
+        self.amplitude_animation.setEndValue(amp_end)
+        self.amplitude_animation.start()
+        if run_wave:
             self.wave_animation.start()
-        elif state == "listening":
-            # Blue with gentle animation for listening
-            self._base_color = QColor(74, 144, 226)  # Blue
-            self.amplitude_animation.setStartValue(self._wave_amplitude)
-            self.amplitude_animation.setEndValue(0.3)
-            self.amplitude_animation.start()
-        elif state == "processing":
-            # Blue with moderate animation for processing
-            self._base_color = QColor(74, 144, 226)  # Blue
-            self.amplitude_animation.setStartValue(self._wave_amplitude)
-            self.amplitude_animation.setEndValue(0.5)
-            self.amplitude_animation.start()
-        else:  # idle
-            # Blue but minimal animation
-            self._base_color = QColor(74, 144, 226)  # Blue
-            self.amplitude_animation.setStartValue(self._wave_amplitude)
-            self.amplitude_animation.setEndValue(0.0)
-            self.amplitude_animation.start()
     
     def paintEvent(self, event):
         """Custom paint event for the Whisper icon"""
@@ -464,33 +581,33 @@ class WhisperIcon(QWidget):
         center_x, center_y = 20, 20
         base_radius = 14
         
-        # Draw animated waves when speaking
+        # Draw animated waves when speaking; pens are cached and only
+        # their alpha is refreshed per frame
         if self._wave_amplitude > 0:
-            for i in range(3):
-                wave_radius = base_radius + (i + 1) * 8 * self._wave_amplitude
-                alpha = int(100 * self._wave_amplitude * (1 - i * 0.3))
-                wave_color = QColor(self._base_color)
-                wave_color.setAlpha(alpha)
-                
-                painter.setBrush(Qt.NoBrush)
-                pen = QPen(wave_color, 2)
+            painter.setBrush(Qt.NoBrush)
+            amplitude = self._wave_amplitude
+            ring_step = 8 * amplitude
+            for i, (pen, color) in enumerate(zip(self._wave_pens, self._wave_colors)):
+                wave_radius = base_radius + (i + 1) * ring_step
+                color.setAlpha(int(100 * amplitude * (1 - i * 0.3)))
+                pen.setColor(color)
                 painter.setPen(pen)
-                painter.drawEllipse(center_x - wave_radius, center_y - wave_radius,
-                                   wave_radius * 2, wave_radius * 2)
+                # QRectF overload strokes the float geometry directly with
+                # no int conversion of the ellipse bounds
+                painter.drawEllipse(QRectF(center_x - wave_radius,
+                                           center_y - wave_radius,
+                                           wave_radius * 2, wave_radius * 2))
         
         # Draw main icon circle
-        gradient = QLinearGradient(0, 0, 40, 40)
-        gradient.setColorAt(0, self._base_color.lighter(120))
-        gradient.setColorAt(1, self._base_color.darker(110))
-        
-        painter.setBrush(QBrush(gradient))
+        painter.setBrush(self._main_brush)
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(center_x - base_radius, center_y - base_radius,
                            base_radius * 2, base_radius * 2)
         
-        # Add white highlight
-        highlight = QColor(255, 255, 255, 120)
-        painter.setBrush(QBrush(highlight))
+        # Add white highlight; interior to the AA'd main circle, so the
+        # unantialiased edge is imperceptible
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setBrush(self._highlight_brush)
         highlight_radius = base_radius - 3
         painter.drawEllipse(center_x - highlight_radius + 2, center_y - highlight_radius + 2,
                            highlight_radius * 2, highlight_radius * 2)
@@ -502,6 +619,7 @@ class ChatBubbleWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(95)
+        self._bubble_pixmap = None  # cached chrome, rebuilt on resize
         self.setup_ui()
         self.apply_styling()
     
@@ -515,11 +633,13 @@ class ChatBubbleWidget(QWidget):
         self.activity_indicator = WhisperIcon()
         layout.addWidget(self.activity_indicator)
         
-        # Command input (takes up remaining width)
-        self.command_input = QTextEdit()
+        # Command input (takes up remaining width). QPlainTextEdit skips
+        # QTextEdit's rich-text shaping and block formatting, which the
+        # transcript text never uses
+        self.command_input = QPlainTextEdit()
         self.command_input.setPlaceholderText("Listening...")
         self.command_input.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 font-family: -apple-system, BlinkMacSystemFont, sans-serif;
                 font-size: 14px;
                 font-weight: 400;
@@ -529,7 +649,7 @@ class ChatBubbleWidget(QWidget):
                 padding: 5px 0px;
                 margin: 0;
             }
-            QTextEdit::placeholder {
+            QPlainTextEdit::placeholder {
                 color: #6B7280;
             }
         """)
@@ -549,27 +669,51 @@ class ChatBubbleWidget(QWidget):
             }
         """)
     
-    def paintEvent(self, event):
-        """Custom paint event for rounded bubble with shadow"""
-        painter = QPainter(self)
+    def _rebuild_bubble_pixmap(self):
+        """Render the static bubble chrome (shadow, gradient fill, border)
+        into a pixmap once per size, so animation-driven repaints of the
+        embedded icon only blit instead of re-running the antialiased
+        rounded-rect fills"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
-        
+
         # Draw shadow
         shadow_rect = QRect(2, 2, self.width() - 4, self.height() - 4)
         shadow_color = QColor(0, 0, 0, 20)
         painter.setBrush(QBrush(shadow_color))
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(shadow_rect, 20, 20)
-        
+
         # Draw main bubble
         main_rect = QRect(0, 0, self.width() - 2, self.height() - 2)
         gradient = QLinearGradient(0, 0, 0, self.height())
         gradient.setColorAt(0, QColor(255, 255, 255))
         gradient.setColorAt(1, QColor(248, 250, 252))
-        
+
         painter.setBrush(QBrush(gradient))
         painter.setPen(QPen(QColor(229, 231, 235), 1))
         painter.drawRoundedRect(main_rect, 20, 20)
+        painter.end()
+
+        self._bubble_pixmap = pixmap
+
+    def resizeEvent(self, event):
+        """Invalidate the cached chrome when the bubble changes size"""
+        super().resizeEvent(event)
+        self._bubble_pixmap = None
+
+    def paintEvent(self, event):
+        """Custom paint event for rounded bubble with shadow"""
+        if self._bubble_pixmap is None:
+            self._rebuild_bubble_pixmap()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bubble_pixmap)
 
 
 class ResponseWidget(QWidget):
@@ -577,6 +721,7 @@ class ResponseWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._clipboard = None  # resolved lazily on first copy
         self.setup_ui()
         self.setVisible(False)  # Hidden by default
     
@@ -591,6 +736,8 @@ class ResponseWidget(QWidget):
         # Response text area
         self.response_display = QTextEdit()
         self.response_display.setReadOnly(True)
+        # Responses are plain text; disabling rich text skips HTML parsing
+        self.response_display.setAcceptRichText(False)
         # Ensure horizontal expansion
         self.response_display.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.MinimumExpanding)
         # Ensure word wrap uses the full widget width
@@ -620,16 +767,15 @@ class ResponseWidget(QWidget):
             doc = self.response_display.document()
             doc.setTextWidth(540 - 32)  # Use minimum width minus padding initially
         
-        from PySide6.QtCore import QTimer
         QTimer.singleShot(1, setup_text_width)
         
         layout.addWidget(self.response_display, 1)  # stretch factor 1
     
     def copy_response(self):
         """Copy response text to clipboard"""
-        from PySide6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.response_display.toPlainText())
+        if self._clipboard is None:
+            self._clipboard = QApplication.clipboard()
+        self._clipboard.setText(self.response_display.toPlainText())
     
     def show_response(self, text: str):
         """Show response with text and adjust height to fit content"""
@@ -643,18 +789,27 @@ class ResponseWidget(QWidget):
         doc = self.response_display.document()
         doc.setTextWidth(self.response_display.width() - 32)  # Account for padding
         
-        # Use QTimer to calculate height after the text is properly rendered
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(10, self._adjust_height)
+        # Document layout is synchronous once the text width is set, so the
+        # height can be computed immediately
+        self._adjust_height()
     
     def _adjust_height(self):
         """Adjust the height based on the actual content size"""
-        # Force the document to update its size
-        self.response_display.document().adjustSize()
-        
-        # Get the document height
-        doc = self.response_display.document()
-        doc_height = doc.size().height()
+        text = self.response_display.toPlainText()
+
+        if len(text) < 200 and '\n' not in text:
+            # Short single-paragraph responses: measure with font metrics
+            # instead of forcing a full QTextDocument layout pass
+            fm = self.response_display.fontMetrics()
+            rect = fm.boundingRect(
+                QRect(0, 0, self.response_display.width() - 32, 10000),
+                Qt.TextWordWrap, text)
+            doc_height = rect.height()
+        else:
+            # Long or multi-paragraph content: let the document lay out
+            doc = self.response_display.document()
+            doc.adjustSize()
+            doc_height = doc.size().height()
         
         # Add padding for the text area (16px * 2 for top/bottom padding)
         total_height = int(doc_height + 40)  # Increased padding for better appearance
@@ -662,8 +817,6 @@ class ResponseWidget(QWidget):
         # Constrain to reasonable bounds
         total_height = max(60, min(300, total_height))
         
-        print(f"📏 Adjusting response height: doc_height={doc_height}, total_height={total_height}")
-        
         self.response_display.setFixedHeight(total_height)
     
     def hide_response(self):
@@ -688,7 +841,6 @@ class ResponseWidget(QWidget):
     def _start_loading_animation(self):
         """Start the animated dots loading effect"""
         if not hasattr(self, '_loading_timer'):
-            from PySide6.QtCore import QTimer
             self._loading_timer = QTimer()
             self._loading_timer.timeout.connect(self._update_loading_dots)
             self._loading_state = 0
@@ -0,0 +1,34 @@
+"""
+Shared HTTP Connection Pool
+===========================
+
+Process-wide requests.Session shared by the backend and Gladia services,
+so repeated requests reuse warm keep-alive (and TLS) connections instead
+of paying a fresh handshake each time.
+
+Author: AI Assistant
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_session = None
+
+
+def get_http_session() -> requests.Session:
+    """Return the shared requests.Session, creating it on first use"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=20)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
+
+def close_http_session():
+    """Close the shared session and drop its pooled connections"""
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
@@ -10,170 +10,237 @@ Handles macOS-specific functionality like:
 Author: AI Assistant
 """
 
-from PySide6.QtCore import QTimer
-
-# macOS integration
-try:
-    from Foundation import NSBundle, NSWorkspace, NSRunningApplication
-    from AppKit import NSApp, NSApplication, NSWindow, NSScreen, NSSpeechSynthesizer
-    from Cocoa import NSPasteboard, NSStringPboardType, NSEvent
-    from Quartz import (
-        CGEventCreateKeyboardEvent, CGEventPost, kCGHIDEventTap,
-        CGEventSourceCreate, kCGEventSourceStateHIDSystemState,
-        CGEventSetFlags, kCGEventFlagMaskCommand
-    )
-    MACOS_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️ macOS frameworks not available: {e}")
-    MACOS_AVAILABLE = False
+import logging
+from types import SimpleNamespace
+
+log = logging.getLogger(__name__)
+
+# PyObjC frameworks, resolved lazily on first use. Importing Foundation/
+# AppKit/Quartz eagerly resolves Objective-C class metadata and can cost
+# hundreds of ms of cold start - paid even on non-mac hosts or when text
+# insertion and TTS are never used. None = not attempted yet, False =
+# attempted and unavailable.
+_macos = None
+
+# CGEventKeyboardSetUnicodeString reliably carries about 20 UTF-16 code
+# units per event, so longer dictation is sent in slices
+_UNICODE_EVENT_MAX_UNITS = 20
+
+# Delegate class for NSSpeechSynthesizer completion callbacks; defined
+# lazily (it must subclass NSObject, which is only imported on demand)
+# and exactly once, since PyObjC registers the Objective-C class name
+# globally
+_SpeechDelegate = None
+
+
+def _speech_delegate_class():
+    """Return the NSObject delegate subclass, defining it on first use"""
+    global _SpeechDelegate
+    if _SpeechDelegate is None:
+        from Foundation import NSObject
+
+        class SpeechDelegate(NSObject):
+            owner = None
+
+            def speechSynthesizer_didFinishSpeaking_(self, synthesizer, success):
+                if self.owner is not None:
+                    self.owner._is_speaking = False
+
+        _SpeechDelegate = SpeechDelegate
+    return _SpeechDelegate
+
+
+def _macos_frameworks():
+    """Return the lazily imported PyObjC namespace, or None if unavailable"""
+    global _macos
+    if _macos is None:
+        try:
+            from Foundation import NSBundle, NSWorkspace
+            from AppKit import (
+                NSApp, NSSpeechSynthesizer,
+                NSApplicationActivateIgnoringOtherApps
+            )
+            from Quartz import (
+                CGEventCreateKeyboardEvent, CGEventPost, kCGHIDEventTap,
+                CGEventSourceCreate, kCGEventSourceStateHIDSystemState,
+                CGEventKeyboardSetUnicodeString
+            )
+            _macos = SimpleNamespace(
+                NSBundle=NSBundle,
+                NSWorkspace=NSWorkspace,
+                NSApp=NSApp,
+                NSApplicationActivateIgnoringOtherApps=NSApplicationActivateIgnoringOtherApps,
+                NSSpeechSynthesizer=NSSpeechSynthesizer,
+                CGEventCreateKeyboardEvent=CGEventCreateKeyboardEvent,
+                CGEventPost=CGEventPost,
+                kCGHIDEventTap=kCGHIDEventTap,
+                CGEventSourceCreate=CGEventSourceCreate,
+                kCGEventSourceStateHIDSystemState=kCGEventSourceStateHIDSystemState,
+                CGEventKeyboardSetUnicodeString=CGEventKeyboardSetUnicodeString,
+            )
+        except ImportError as e:
+            log.warning("⚠️ macOS frameworks not available: %s", e)
+            _macos = False
+    return _macos or None
 
 
 class MacOSIntegration:
     """Handles macOS-specific functionality"""
-    
+
     def __init__(self, main_window):
         self.main_window = main_window
         self.original_app = None
+        # Both created on first use so __init__ stays off the startup
+        # critical path
         self.speech_synthesizer = None
-        if MACOS_AVAILABLE:
+        self.event_source = None
+        # Mirrors the synthesizer's speaking state in Python, kept
+        # current by the delegate callback, so hot paths don't cross
+        # the PyObjC bridge just to ask isSpeaking()
+        self._is_speaking = False
+        self._speech_delegate = None
+        # Our own bundle identifier never changes; fetched once on the
+        # first focus swap instead of two bridge calls per bring_to_front
+        self._own_bundle_id = None
+
+    def _get_speech_synthesizer(self):
+        """Lazy-init the speech synthesizer on first speak_text call"""
+        if self.speech_synthesizer is None:
+            macos = _macos_frameworks()
+            if macos is None:
+                return None
             try:
-                self.speech_synthesizer = NSSpeechSynthesizer.alloc().init()
-                print("✅ Speech synthesizer initialized successfully")
+                self.speech_synthesizer = macos.NSSpeechSynthesizer.alloc().init()
+                self._speech_delegate = _speech_delegate_class().alloc().init()
+                self._speech_delegate.owner = self
+                self.speech_synthesizer.setDelegate_(self._speech_delegate)
+                log.info("✅ Speech synthesizer initialized successfully")
             except Exception as e:
-                print(f"❌ Failed to initialize speech synthesizer: {e}")
-                self.speech_synthesizer = None
-    
+                log.error("❌ Failed to initialize speech synthesizer: %s", e)
+        return self.speech_synthesizer
+
     def bring_to_front(self):
         """Bring app window to front"""
-        if not MACOS_AVAILABLE:
+        macos = _macos_frameworks()
+        if macos is None:
             self.main_window.raise_()
             self.main_window.activateWindow()
             return
-            
+
         try:
             # Store current frontmost app
-            workspace = NSWorkspace.sharedWorkspace()
+            workspace = macos.NSWorkspace.sharedWorkspace()
             frontmost = workspace.frontmostApplication()
-            
-            if frontmost and frontmost.bundleIdentifier() != NSBundle.mainBundle().bundleIdentifier():
+
+            if self._own_bundle_id is None:
+                self._own_bundle_id = macos.NSBundle.mainBundle().bundleIdentifier()
+            if frontmost and frontmost.bundleIdentifier() != self._own_bundle_id:
                 self.original_app = frontmost
-            
-            # Activate our app
-            NSApp.activateIgnoringOtherApps_(True)
-            self.main_window.raise_()
+
+            # Activate our app. NSApp activation already orders the key
+            # window front, so Qt's raise_() would be a redundant bridge
+            # call; activateWindow() stays for Qt's focus bookkeeping.
+            macos.NSApp.activateIgnoringOtherApps_(True)
             self.main_window.activateWindow()
         except Exception as e:
-            print(f"❌ Failed to bring window to front: {e}")
+            log.error("❌ Failed to bring window to front: %s", e)
             self.main_window.raise_()
             self.main_window.activateWindow()
-    
+
     def restore_original_app(self):
         """Restore focus to original app"""
-        if not MACOS_AVAILABLE or not self.original_app:
+        if not self.original_app:
             return
-            
+
         try:
-            self.original_app.activateWithOptions_(0)
+            macos = _macos_frameworks()
+            self.original_app.activateWithOptions_(
+                macos.NSApplicationActivateIgnoringOtherApps)
             self.original_app = None
         except Exception as e:
-            print(f"❌ Failed to restore original app: {e}")
-    
+            log.error("❌ Failed to restore original app: %s", e)
+
+    @staticmethod
+    def _utf16_chunks(text: str):
+        """Split text into slices of at most _UNICODE_EVENT_MAX_UNITS
+        UTF-16 code units, never splitting a surrogate pair"""
+        units = text.encode('utf-16-le')
+        step = _UNICODE_EVENT_MAX_UNITS * 2
+        i = 0
+        while i < len(units):
+            end = min(i + step, len(units))
+            # Don't end a chunk on a high surrogate (0xD800-0xDBFF)
+            if end < len(units):
+                last = units[end - 2] | (units[end - 1] << 8)
+                if 0xD800 <= last <= 0xDBFF:
+                    end += 2
+            yield units[i:end].decode('utf-16-le')
+            i = end
+
     def insert_text_at_cursor(self, text: str):
-        """Insert text at current cursor position using macOS pasteboard"""
-        if not MACOS_AVAILABLE:
-            print(f"⚠️ macOS not available - cannot insert text: {text}")
-            return
-            
-        try:
-            # Get current pasteboard content
-            pasteboard = NSPasteboard.generalPasteboard()
-            original_content = pasteboard.stringForType_(NSStringPboardType)
-            
-            # Set our text to pasteboard
-            pasteboard.clearContents()
-            pasteboard.setString_forType_(text, NSStringPboardType)
-            
-            # Create Cmd+V event
-            source = CGEventSourceCreate(kCGEventSourceStateHIDSystemState)
-            
-            # Cmd key down + V key down
-            cmd_v_down = CGEventCreateKeyboardEvent(source, 9, True)  # V key
-            CGEventSetFlags(cmd_v_down, kCGEventFlagMaskCommand)
-            
-            # Cmd key up + V key up  
-            cmd_v_up = CGEventCreateKeyboardEvent(source, 9, False)  # V key
-            
-            # Post events
-            CGEventPost(kCGHIDEventTap, cmd_v_down)
-            CGEventPost(kCGHIDEventTap, cmd_v_up)
-            
-            # Restore original pasteboard content after delay
-            QTimer.singleShot(100, lambda: self.restore_pasteboard(original_content))
-            
-            print(f"✅ Text inserted via Cmd+V: {text}")
-            
-        except Exception as e:
-            print(f"❌ Failed to insert text: {e}")
-    
-    def restore_pasteboard(self, original_content: str):
-        """Restore original pasteboard content"""
-        if not MACOS_AVAILABLE or not original_content:
+        """Insert text at current cursor position via synthetic key events"""
+        macos = _macos_frameworks()
+        if macos is None:
+            log.warning("⚠️ macOS not available - cannot insert text: %s", text)
             return
-            
+
         try:
-            pasteboard = NSPasteboard.generalPasteboard()
-            pasteboard.clearContents()
-            pasteboard.setString_forType_(original_content, NSStringPboardType)
+            # Inject the characters directly with
+            # CGEventKeyboardSetUnicodeString instead of routing through
+            # the pasteboard: no clipboard clobbering, no 100ms restore
+            # window, and no contention with clipboard managers.
+            # One event source for the lifetime of the integration;
+            # creating it per keystroke batch costs an IOKit round-trip.
+            if self.event_source is None:
+                self.event_source = macos.CGEventSourceCreate(
+                    macos.kCGEventSourceStateHIDSystemState)
+            source = self.event_source
+
+            for chunk in self._utf16_chunks(text):
+                n = len(chunk.encode('utf-16-le')) // 2
+                key_down = macos.CGEventCreateKeyboardEvent(source, 0, True)
+                macos.CGEventKeyboardSetUnicodeString(key_down, n, chunk)
+                macos.CGEventPost(macos.kCGHIDEventTap, key_down)
+
+                key_up = macos.CGEventCreateKeyboardEvent(source, 0, False)
+                macos.CGEventKeyboardSetUnicodeString(key_up, n, chunk)
+                macos.CGEventPost(macos.kCGHIDEventTap, key_up)
+
+            log.info("✅ Text inserted via synthetic typing: %s", text)
+
         except Exception as e:
-            print(f"❌ Failed to restore pasteboard: {e}")
-    
+            log.error("❌ Failed to insert text: %s", e)
+
     def speak_text(self, text: str):
         """Speak text using macOS built-in text-to-speech"""
-        print(f"🔊 speak_text called with: '{text}'")
-        print(f"🔊 MACOS_AVAILABLE: {MACOS_AVAILABLE}")
-        print(f"🔊 speech_synthesizer exists: {self.speech_synthesizer is not None}")
-        
-        if not MACOS_AVAILABLE:
-            print(f"⚠️ macOS not available - cannot speak: {text}")
+        synthesizer = self._get_speech_synthesizer()
+        if synthesizer is None:
+            log.warning("⚠️ Speech synthesis not available - cannot speak: %s", text)
             return
-            
-        if not self.speech_synthesizer:
-            print(f"⚠️ Speech synthesizer not initialized - cannot speak: {text}")
-            return
-            
+
         try:
-            # Check if synthesizer is available
-            if not self.speech_synthesizer:
-                print("❌ Speech synthesizer is None")
-                return
-                
-            # Stop any current speech
-            is_speaking = self.speech_synthesizer.isSpeaking()
-            print(f"🔊 Currently speaking: {is_speaking}")
-            if is_speaking:
-                print("🔇 Stopping current speech")
-                self.speech_synthesizer.stopSpeaking()
-            
+            # Stop any current speech; the cached flag avoids an
+            # isSpeaking() bridge call per invocation
+            if self._is_speaking:
+                log.debug("🔇 Stopping current speech")
+                synthesizer.stopSpeaking()
+
             # Speak the text
-            print(f"🔊 About to call startSpeakingString_ with: '{text}'")
-            result = self.speech_synthesizer.startSpeakingString_(text)
-            print(f"🔊 startSpeakingString_ returned: {result}")
-            
-            # Check if speaking started
-            is_speaking_after = self.speech_synthesizer.isSpeaking()
-            print(f"🔊 Speaking after start: {is_speaking_after}")
-            
+            log.debug("🔊 About to call startSpeakingString_ with: '%s'", text)
+            result = synthesizer.startSpeakingString_(text)
+            self._is_speaking = bool(result)
+            log.debug("🔊 startSpeakingString_ returned: %s", result)
+
         except Exception as e:
-            print(f"❌ Exception in speak_text: {e}")
-            print(f"❌ Exception type: {type(e)}")
+            log.error("❌ Exception in speak_text: %s", e)
             import traceback
             traceback.print_exc()
-    
+
     def stop_speaking(self):
         """Stop current speech synthesis"""
-        if MACOS_AVAILABLE and self.speech_synthesizer and self.speech_synthesizer.isSpeaking():
+        if self.speech_synthesizer and self._is_speaking:
             try:
                 self.speech_synthesizer.stopSpeaking()
-                print("🔇 Speech stopped")
+                log.debug("🔇 Speech stopped")
             except Exception as e:
-                print(f"❌ Failed to stop speech: {e}")
\ No newline at end of file
+                log.error("❌ Failed to stop speech: %s", e)
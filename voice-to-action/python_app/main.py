@@ -22,6 +22,7 @@ Author: AI Assistant
 Version: 1.0.0 (Refactored)
 """
 
+import logging
 import sys
 from PySide6.QtWidgets import QApplication
 from dotenv import load_dotenv
@@ -41,7 +42,12 @@ def main():
     """Main application entry point"""
     print("🚀 Control Flow - Python Voice Agent v1.0 (Refactored)")
     print("=" * 60)
-    
+
+    # INFO by default; per-response debug traces only appear when a
+    # developer drops this to DEBUG
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
     # Check permissions first
     if not PermissionManager.request_all_permissions():
         print("❌ Some permissions not granted - continuing with limited functionality")
@@ -7,24 +7,77 @@ Main application window with GUI layout and event handling.
 Author: AI Assistant
 """
 
+import logging
+import queue
 import threading
 from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTextEdit, QPushButton, QLabel, QFrame, QMessageBox, QScrollArea
+    QTextEdit, QPushButton, QLabel, QFrame, QScrollArea
 )
-from PySide6.QtCore import QTimer, Qt, Signal, QObject, QPropertyAnimation, QEasingCurve, QRect, QSize
+from PySide6.QtCore import QTimer, Qt, Signal, QObject, QPropertyAnimation, QEasingCurve, QRect, QSize, QThreadPool
 from PySide6.QtGui import QFont, QColor, QLinearGradient, QPalette, QPainter, QBrush, QPen, QPixmap
 
 from gui_components import StatusIndicator, ModernCard, ActivityIndicator, ChatBubbleWidget, ResponseWidget
 from voice_recognition import SpeechRecognitionThread
 from backend_service import BackendService
 from macos_integration import MacOSIntegration
+from http_pool import get_http_session
+from concurrent.futures import ThreadPoolExecutor
+import io
 import requests
-import tempfile
-import threading
 import pygame
-import os
+
+log = logging.getLogger(__name__)
+
+# How many decoded audio clips to keep around for repeated responses
+_SOUND_CACHE_MAX = 8
+
+# Mixer settings: the TTS provider's native rate, and a small device
+# buffer (~12 ms at 44.1 kHz) so playback starts quickly without
+# audible underruns
+_MIXER_FREQUENCY = 44100
+_MIXER_BUFFER = 512
+
+# Status text -> style variant, scanned in order; first match wins
+_STATUS_CATEGORIES = (
+    ("error", ("error", "failed")),
+    ("success", ("completed", "\u2705")),
+    ("active", ("processing", "listening")),
+)
+
+# Status label stylesheet, parsed by Qt exactly once. update_status
+# runs on every status signal from the speech thread, so state changes
+# swap a dynamic property instead of re-applying (and re-parsing) a
+# fresh sheet per call.
+_STATUS_QSS = """
+    QLabel {
+        font-size: 14px;
+        font-weight: 600;
+        padding: 8px 16px;
+        border-radius: 12px;
+    }
+    QLabel[state="error"] {
+        color: #DC2626;
+        background-color: #FEF2F2;
+        border: 1px solid #FECACA;
+    }
+    QLabel[state="success"] {
+        color: #059669;
+        background-color: #ECFDF5;
+        border: 1px solid #A7F3D0;
+    }
+    QLabel[state="active"] {
+        color: #2563EB;
+        background-color: #EFF6FF;
+        border: 1px solid #BFDBFE;
+    }
+    QLabel[state="neutral"] {
+        color: #374151;
+        background-color: #F3F4F6;
+    }
+"""
 
 
 class MainWindow(QMainWindow):
@@ -32,6 +85,16 @@ class MainWindow(QMainWindow):
     
     # Signal for backend response
     backend_response_received = Signal(dict)
+
+    # Emitted from the health-probe worker with the backend's state
+    backend_health_changed = Signal(bool)
+
+    # Emitted from the playback worker as a clip starts and finishes.
+    # The indicator animations and the collapse timer both live on the
+    # GUI thread (QPropertyAnimation/QTimer cannot be started from a
+    # worker), so all playback-driven transitions hop over via queued
+    # signal delivery.
+    playback_state_changed = Signal(str)
     
     def __init__(self, backend_url: str = "http://127.0.0.1:8000"):
         super().__init__()
@@ -39,16 +102,32 @@ class MainWindow(QMainWindow):
         self.macos_integration = MacOSIntegration(self)
         self.speech_thread = None
         self.session_id = None
-        self.pulse_animation = None
-        
-        # Initialize pygame mixer for audio playback
-        try:
-            pygame.mixer.init()
-            self.audio_available = True
-            print("✅ Pygame mixer initialized for audio playback")
-        except Exception as e:
-            print(f"⚠️ Audio playback not available: {e}")
-            self.audio_available = False
+        self._closing = False
+
+        # Cache of decoded pygame Sounds keyed by audio_url, so repeated
+        # responses (chimes, canned confirmations) decode only once
+        self._sound_cache = {}
+
+        # Bounded pool for audio downloads: avoids per-clip thread spawn
+        # and caps concurrency if several audio URLs arrive back to back.
+        # Its workers are non-daemon, so the stop event below lets an
+        # in-flight playback wait bail out at shutdown instead of holding
+        # the interpreter alive for the rest of the clip.
+        self._audio_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="audio")
+        self._audio_stop = threading.Event()
+
+        # Single persistent dispatch worker for backend commands. One
+        # utterance is in flight at a time and the queue is drained
+        # last-write-wins, so saying "Hey Flow" again before the backend
+        # answers supersedes the stale command instead of racing it.
+        self._command_queue = queue.Queue()
+        self._command_worker_thread = threading.Thread(
+            target=self._command_worker, daemon=True, name="command-dispatch")
+        self._command_worker_thread.start()
+
+        # Mixer init probes audio devices (50-200 ms on macOS), so it is
+        # deferred to the first playback; None = not attempted yet
+        self.audio_available = None
         
         # Setup UI
         self.setup_ui()
@@ -56,12 +135,21 @@ class MainWindow(QMainWindow):
         
         # Connect backend response signal
         self.backend_response_received.connect(self.handle_backend_response)
-        
-        # Check backend connection
-        self.check_backend_connection()
-        
-        # Start speech recognition
-        self.start_speech_recognition()
+        self.backend_health_changed.connect(self._on_backend_health)
+        self.playback_state_changed.connect(self._on_playback_state_changed)
+
+        # One reusable single-shot timer for collapsing the window, so a
+        # new delay simply restarts it instead of allocating a QTimer
+        # per response (and stacking stale collapses)
+        self._collapse_timer = QTimer(self)
+        self._collapse_timer.setSingleShot(True)
+        self._collapse_timer.timeout.connect(self.collapse_window)
+        
+        # Defer the backend probe and recognition startup until after
+        # the first frame paints, so show() isn't blocked on network or
+        # audio-device setup
+        QTimer.singleShot(0, self.check_backend_connection)
+        QTimer.singleShot(0, self.start_speech_recognition)
     
     def setup_ui(self):
         """Setup sleek modern UI matching the reference screenshots"""
@@ -81,17 +169,34 @@ class MainWindow(QMainWindow):
         self.resize_animation.setDuration(300)
         self.resize_animation.setEasingCurve(QEasingCurve.OutCubic)
         
-        # Apply modern gradient background
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #E8F4FD, stop:1 #F0F8FF);
-            }
-        """)
-        
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
+
+        # Paint the gradient background through the central widget's
+        # palette and declare the widget opaque: Qt then skips
+        # compositing the window layer underneath it on every
+        # signal-driven indicator repaint, instead of re-filling the
+        # full client area per update. The gradient is rasterized once
+        # into a pixmap so each fill is a blit rather than per-pixel
+        # gradient interpolation - the 300 ms expand/collapse animation
+        # repaints this background at full frame rate. Width is fixed
+        # and height never exceeds expanded_height, so the pixmap never
+        # needs regenerating.
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.window_width * dpr), int(self.expanded_height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        gradient = QLinearGradient(0, 0, self.window_width, self.expanded_height)
+        gradient.setColorAt(0.0, QColor("#E8F4FD"))
+        gradient.setColorAt(1.0, QColor("#F0F8FF"))
+        painter = QPainter(pixmap)
+        painter.fillRect(0, 0, self.window_width, self.expanded_height, QBrush(gradient))
+        painter.end()
+        palette = central_widget.palette()
+        palette.setBrush(QPalette.Window, QBrush(pixmap))
+        central_widget.setPalette(palette)
+        central_widget.setAutoFillBackground(True)
+        central_widget.setAttribute(Qt.WA_OpaquePaintEvent, True)
         
         # Main layout with precise spacing like reference
         layout = QVBoxLayout(central_widget)
@@ -103,7 +208,17 @@ class MainWindow(QMainWindow):
         self.voice_indicator = StatusIndicator(QColor(100, 149, 237))
         self.backend_indicator = StatusIndicator(QColor(128, 128, 128))
         self.status_label = QLabel()
-        
+        self.status_label.setStyleSheet(_STATUS_QSS)
+        self.status_label.setProperty("state", "neutral")
+        
+        # Non-modal error banner, hidden until a speech error occurs
+        self.error_banner = QLabel()
+        self.error_banner.setWordWrap(True)
+        self.error_banner.setStyleSheet(_STATUS_QSS)
+        self.error_banner.setProperty("state", "error")
+        self.error_banner.setVisible(False)
+        layout.addWidget(self.error_banner)
+
         # Chat bubble container - this is the main UI element
         self.chat_bubble = ChatBubbleWidget()
         layout.addWidget(self.chat_bubble)
@@ -152,42 +267,64 @@ class MainWindow(QMainWindow):
     def start_speech_recognition(self):
         """Start the speech recognition thread"""
         if self.speech_thread and not self.speech_thread.isRunning():
-            print("🎤 Starting speech recognition...")
+            log.debug("🎤 Starting speech recognition...")
             self.speech_thread.start()
-            
-            # Update indicators
-            self.wake_word_indicator.set_color(QColor(34, 139, 34))  # Green
-            self.voice_indicator.set_color(QColor(100, 149, 237))   # Blue
-            
-            # Set activity indicator to listening state
-            self.activity_indicator.set_state("listening")
+
+            # Update indicators as one batch so the window repaints once
+            self.setUpdatesEnabled(False)
+            try:
+                self.wake_word_indicator.set_color(QColor(34, 139, 34))  # Green
+                self.voice_indicator.set_color(QColor(100, 149, 237))   # Blue
+
+                # Set activity indicator to listening state
+                self.activity_indicator.set_state("listening")
+            finally:
+                self.setUpdatesEnabled(True)
     
     def stop_speech_recognition(self):
         """Stop the speech recognition thread"""
         if self.speech_thread and self.speech_thread.isRunning():
-            print("🛑 Stopping speech recognition...")
+            log.debug("🛑 Stopping speech recognition...")
             self.speech_thread.stop()
-            self.speech_thread.wait(3000)  # Wait up to 3 seconds
             
-            # Update indicators
-            self.wake_word_indicator.set_color(QColor(128, 128, 128))  # Gray
-            self.voice_indicator.set_color(QColor(128, 128, 128))     # Gray
-            
-            # Set activity indicator to idle state
-            self.activity_indicator.set_state("idle")
+            # Update indicators as one batch so the window repaints once
+            self.setUpdatesEnabled(False)
+            try:
+                self.wake_word_indicator.set_color(QColor(128, 128, 128))  # Gray
+                self.voice_indicator.set_color(QColor(128, 128, 128))     # Gray
+
+                # Set activity indicator to idle state
+                self.activity_indicator.set_state("idle")
+            finally:
+                self.setUpdatesEnabled(True)
     
     def check_backend_connection(self):
-        """Check backend connection and update indicator"""
-        if self.backend_service.check_health():
+        """Probe backend health off the GUI thread"""
+        # The HTTP call can take up to its 5s timeout against a dead
+        # backend; run it on the global pool and update the indicator
+        # when the signal comes back
+        QThreadPool.globalInstance().start(
+            lambda: self.backend_health_changed.emit(self.backend_service.check_health()))
+
+    def _on_playback_state_changed(self, state: str):
+        """Apply playback-driven indicator transitions on the GUI thread"""
+        self.activity_indicator.set_state(state)
+        if state == "listening":
+            # Clip finished; collapse the window 10 seconds later
+            self._collapse_timer.start(10000)
+
+    def _on_backend_health(self, healthy: bool):
+        """Update the backend indicator from a health probe result"""
+        if healthy:
             self.backend_indicator.set_color(QColor(34, 139, 34))  # Green
-            print("✅ Backend connection healthy")
+            log.info("✅ Backend connection healthy")
         else:
             self.backend_indicator.set_color(QColor(220, 20, 60))   # Crimson
-            print("❌ Backend connection failed")
+            log.error("❌ Backend connection failed")
     
     def handle_wake_word_command(self, command: str):
         """Handle command from wake word detection"""
-        print(f"🎯 Processing wake word command: {command}")
+        log.debug("🎯 Processing wake word command: %s", command)
         
         # Bring app to front and focus
         self.macos_integration.bring_to_front()
@@ -200,7 +337,7 @@ class MainWindow(QMainWindow):
     
     def handle_dictation(self, text: str):
         """Handle dictation from Orange wake word"""
-        print(f"🍊 Processing orange dictation: {text}")
+        log.debug("🍊 Processing orange dictation: %s", text)
         
         # Insert text at current cursor position using macOS APIs
         self.macos_integration.insert_text_at_cursor(text + " ")
@@ -208,10 +345,10 @@ class MainWindow(QMainWindow):
     def handle_user_speaking(self, is_speaking: bool):
         """Handle user speaking state for animation"""
         if is_speaking:
-            print("🎤 User is speaking")
+            log.debug("🎤 User is speaking")
             self.activity_indicator.set_state("user_speaking")
         else:
-            print("🔇 User stopped speaking")
+            log.debug("🔇 User stopped speaking")
             self.activity_indicator.set_state("listening")
     
     def execute_current_command(self):
@@ -223,7 +360,7 @@ class MainWindow(QMainWindow):
         if not command.strip():
             return
             
-        print(f"🚀 Executing command: {command}")
+        log.debug("🚀 Executing command: %s", command)
         
         # Start processing animation
         self.start_processing_animation()
@@ -236,229 +373,242 @@ class MainWindow(QMainWindow):
         if self.speech_thread:
             self.speech_thread.set_backend_processing(True)
         
-        # Execute in background thread to avoid blocking UI
-        def execute():
+        # Hand off to the persistent dispatch worker, superseding any
+        # command still waiting in the queue (last-write-wins)
+        try:
+            while True:
+                self._command_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._command_queue.put(command)
+
+    def _command_worker(self):
+        """Persistent dispatch loop: runs one backend command at a time"""
+        while True:
+            command = self._command_queue.get()
+            if command is None:
+                break
             try:
                 response = self.backend_service.execute_command(command, self.session_id)
-                print(f"🔄 Thread received response: {response}")
-                
+                log.debug("🔄 Worker received response: %s", response)
+
                 # Emit signal to update UI on main thread
-                print(f"🔄 Emitting backend_response_received signal")
+                log.debug("🔄 Emitting backend_response_received signal")
                 self.backend_response_received.emit(response)
-                
+
             except Exception as e:
-                print(f"❌ Exception in background thread: {e}")
+                log.error("❌ Exception in command worker: %s", e)
                 error_response = {
                     "status": "error",
                     "message": f"Execution error: {e}",
                     "agent_type": "error"
                 }
-                
-                print(f"🔄 Emitting error response signal")
-                self.activity_indicator.set_state("error")
-                QTimer.singleShot(2000, lambda: self.activity_indicator.set_state("listening"))
+
+                log.debug("🔄 Emitting error response signal")
                 self.backend_response_received.emit(error_response)
-        
-        # Run in thread
-        threading.Thread(target=execute, daemon=True).start()
-    
+
     def handle_backend_response(self, response: Dict[str, Any]):
         """Handle response from backend"""
         try:
-            print(f"🔍 Handling backend response: {response}")
+            log.debug("🔍 Handling backend response: %s", response)
             
             message = response.get("message", "No response")
             agent_type = response.get("agent_type", "unknown")
             status = response.get("status", "unknown")
             
-            print(f"📝 Extracted message: '{message}'")
-            print(f"📝 Status: '{status}', Agent type: '{agent_type}'")
+            log.debug("📝 Extracted message: '%s'", message)
+            log.debug("📝 Status: '%s', Agent type: '%s'", status, agent_type)
             
             # Update response display and expand window
             self.response_container.show_response(message)
             self.expand_window()
-            print(f"🖥️ Updated response display with: {message}")
+            log.debug("🖥️ Updated response display with: %s", message)
             
             # Play audio from backend if available
             audio_url = response.get("audio_url")
+            self.stop_processing_animation()
             if audio_url:
-                print(f"🔊 Playing audio from backend: {audio_url}")
+                log.debug("🔊 Playing audio from backend: %s", audio_url)
+                # The playback worker drives the state machine from here
+                # (agent_speaking -> listening), so no transition now
                 self._play_audio_from_url(audio_url)
             else:
-                print("⚠️ No audio URL provided by backend")
-                # If no audio, return to listening state immediately
-                QTimer.singleShot(1000, lambda: self.activity_indicator.set_state("listening"))
-            
-            # Stop processing animation and return to listening (audio will handle green state)
-            self.stop_processing_animation()
-            self.activity_indicator.set_state("listening")
-            
+                log.warning("⚠️ No audio URL provided by backend")
+                self.activity_indicator.set_state("listening")
+                # Window collapse is handled after audio completion when
+                # audio is playing
+                self._collapse_timer.start(8000)
+
             # Clear command input
             self.command_input.clear()
-            
-            # Return to listening state will be handled by audio playback completion
-            # or immediately if no audio is played
-            
+
             # Restore original app focus after delay (wait longer for TTS to finish)
             QTimer.singleShot(3000, self.macos_integration.restore_original_app)
-            
-            # Window collapse will be handled after audio completion
-            # or immediately if no audio is played
-            if not audio_url:
-                QTimer.singleShot(8000, self.collapse_window)
-            
-            print(f"✅ Command completed: {message}")
+
+            log.info("✅ Command completed: %s", message)
             
         except Exception as e:
-            print(f"❌ Error in handle_backend_response: {e}")
-            print(f"❌ Response data: {response}")
+            log.error("❌ Error in handle_backend_response: %s", e)
+            log.error("❌ Response data: %s", response)
         finally:
             # Re-enable speech recognition
             if self.speech_thread:
                 self.speech_thread.set_backend_processing(False)
     
+    def _ensure_mixer(self) -> bool:
+        """Initialize the pygame mixer on first playback"""
+        if self.audio_available is None:
+            # Pre-init at the TTS provider's native 44.1 kHz so SDL
+            # doesn't resample every clip, with a small buffer for low
+            # playback start latency
+            try:
+                pygame.mixer.pre_init(frequency=_MIXER_FREQUENCY, size=-16,
+                                      channels=2, buffer=_MIXER_BUFFER)
+                pygame.mixer.init()
+                self.audio_available = True
+                log.info("✅ Pygame mixer initialized for audio playback")
+            except Exception as e:
+                log.warning("⚠️ Audio playback not available: %s", e)
+                self.audio_available = False
+        return self.audio_available
+
     def _play_audio_from_url(self, audio_url: str):
         """Download and play audio from URL"""
-        if not self.audio_available:
-            print("⚠️ Audio playback not available")
+        if not self._ensure_mixer():
+            log.warning("⚠️ Audio playback not available")
             return
             
         if not audio_url or not audio_url.strip():
-            print("⚠️ Empty or invalid audio URL")
+            log.warning("⚠️ Empty or invalid audio URL")
             return
             
         def play_audio():
-            temp_file_path = None
             try:
-                print(f"🎵 Downloading audio from: {audio_url}")
-                
-                # Add headers for better compatibility with MiniMax URLs
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                }
-                
-                # Download audio file
-                response = requests.get(audio_url, timeout=30, headers=headers)
-                if response.status_code == 200:
-                    # Determine file extension based on content type or URL
-                    content_type = response.headers.get('content-type', '').lower()
-                    if 'audio/mpeg' in content_type or audio_url.endswith('.mp3'):
-                        suffix = '.mp3'
-                    elif 'audio/wav' in content_type or audio_url.endswith('.wav'):
-                        suffix = '.wav'
-                    else:
-                        suffix = '.mp3'  # Default to mp3
-                    
-                    # Create temporary file
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-                        temp_file.write(response.content)
-                        temp_file_path = temp_file.name
-                    
-                    print(f"🎵 Playing audio file: {temp_file_path}")
-                    
-                    # Play audio using pygame
-                    pygame.mixer.music.load(temp_file_path)
-                    pygame.mixer.music.play()
-                    
-                    print("🎵 Audio playback started - setting green animation and disabling speech recognition")
-                    # Set agent speaking animation when audio starts
-                    self.activity_indicator.set_state("agent_speaking")
-                    
-                    # Disable speech recognition while agent is speaking
-                    if self.speech_thread:
-                        self.speech_thread.set_backend_processing(True)
-                    
-                    # Wait for playback to complete
-                    while pygame.mixer.music.get_busy():
-                        pygame.time.wait(100)
-                    
-                    print("🎵 Audio playback completed - returning to blue animation and re-enabling speech recognition")
-                    # Return to listening state when audio actually completes
-                    self.activity_indicator.set_state("listening")
-                    
-                    # Re-enable speech recognition after agent finishes speaking
-                    if self.speech_thread:
-                        self.speech_thread.set_backend_processing(False)
-                    
-                    # Schedule window collapse 10 seconds after audio completes
-                    QTimer.singleShot(10000, self.collapse_window)
-                    print("✅ Audio playback completed")
-                    
+                sound = self._sound_cache.get(self._sound_cache_key(audio_url))
+                if sound is None:
+                    sound = self._download_and_decode(audio_url)
+                    if sound is None:
+                        return
                 else:
-                    print(f"❌ Failed to download audio: HTTP {response.status_code}")
-                    print(f"Response headers: {dict(response.headers)}")
-                    
-            except requests.exceptions.Timeout:
-                print("❌ Timeout downloading audio file")
-            except requests.exceptions.RequestException as e:
-                print(f"❌ Network error downloading audio: {e}")
+                    log.debug("🎵 Reusing cached audio for: %s", audio_url)
+
+                # Play the pre-decoded buffer
+                channel = sound.play()
+
+                log.debug("🎵 Audio playback started - setting green animation and disabling speech recognition")
+                # Set agent speaking animation when audio starts
+                self.playback_state_changed.emit("agent_speaking")
+
+                # Disable speech recognition while agent is speaking
+                if self.speech_thread:
+                    self.speech_thread.set_backend_processing(True)
+
+                # Wait for playback to complete. The decoded length is
+                # known, so block once for the whole clip instead of
+                # waking at 10 Hz to poll get_busy(); a short tail poll
+                # absorbs mixer buffering slack. Waiting on the stop
+                # event rather than time.sleep() lets closeEvent cut the
+                # wait short, so shutdown isn't pinned on clip length.
+                if channel is not None:
+                    self._audio_stop.wait(sound.get_length())
+                    while channel.get_busy() and not self._audio_stop.is_set():
+                        pygame.time.wait(10)
+                if self._audio_stop.is_set():
+                    # Shutting down; the mixer is already stopped and the
+                    # window is going away, so skip the follow-up work
+                    return
+
+                log.debug("🎵 Audio playback completed - returning to blue animation and re-enabling speech recognition")
+                # Return to listening state (and arm the collapse timer)
+                # when audio actually completes
+                self.playback_state_changed.emit("listening")
+
+                # Re-enable speech recognition after agent finishes speaking
+                if self.speech_thread:
+                    self.speech_thread.set_backend_processing(False)
+                log.info("✅ Audio playback completed")
+
             except Exception as e:
-                print(f"❌ Error playing audio: {e}")
-            finally:
-                # Clean up temporary file
-                if temp_file_path and os.path.exists(temp_file_path):
-                    try:
-                        os.unlink(temp_file_path)
-                        print("🗑️ Cleaned up temporary audio file")
-                    except Exception as e:
-                        print(f"⚠️ Failed to clean up temp file: {e}")
-        
-        # Play audio in background thread
-        threading.Thread(target=play_audio, daemon=True).start()
-    
+                log.error("❌ Error playing audio: %s", e)
+
+        # Play audio on the bounded download/playback pool
+        self._audio_executor.submit(play_audio)
+
+    @staticmethod
+    def _sound_cache_key(audio_url: str) -> str:
+        """Cache key for a clip URL: the path identifies the object, while
+        the query string carries volatile presigning parameters, so it is
+        stripped to let re-signed URLs for the same clip still hit"""
+        return urlsplit(audio_url)._replace(query="", fragment="").geturl()
+
+    def _download_and_decode(self, audio_url: str):
+        """Download a clip, decode it into a pygame Sound and cache it"""
+        try:
+            log.debug("🎵 Downloading audio from: %s", audio_url)
+
+            # Add headers for better compatibility with MiniMax URLs
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            }
+
+            # Shared keep-alive session: skips a fresh TCP+TLS handshake on
+            # every clip fetched from the same host
+            session = get_http_session()
+            with session.get(audio_url, timeout=30, headers=headers, stream=True) as response:
+                if response.status_code != 200:
+                    log.error("❌ Failed to download audio: HTTP %s", response.status_code)
+                    log.debug("Response headers: %s", dict(response.headers))
+                    return None
+
+                # Collect the clip in memory; SDL sniffs the format from
+                # the magic bytes, so no filename suffix is needed and the
+                # tempfile round-trip (write, decode, unlink) goes away
+                buf = io.BytesIO()
+                for chunk in response.iter_content(chunk_size=65536):
+                    buf.write(chunk)
+                buf.seek(0)
+
+            # Decode once into raw PCM; the download buffer is free to be
+            # collected afterwards
+            sound = pygame.mixer.Sound(file=buf)
+
+            if len(self._sound_cache) >= _SOUND_CACHE_MAX:
+                self._sound_cache.pop(next(iter(self._sound_cache)))
+            self._sound_cache[self._sound_cache_key(audio_url)] = sound
+            return sound
+
+        except requests.exceptions.Timeout:
+            log.error("❌ Timeout downloading audio file")
+            return None
+        except requests.exceptions.RequestException as e:
+            log.error("❌ Network error downloading audio: %s", e)
+            return None
+        except Exception as e:
+            log.error("❌ Error decoding audio: %s", e)
+            return None
+
     def update_status(self, status: str):
         """Update status label with modern styling"""
         self.status_label.setText(status)
-        
-        # Add different styling based on status type
-        if "error" in status.lower() or "failed" in status.lower():
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: #DC2626;
-                    padding: 8px 16px;
-                    background-color: #FEF2F2;
-                    border: 1px solid #FECACA;
-                    border-radius: 12px;
-                }
-            """)
-        elif "completed" in status.lower() or "✅" in status:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: #059669;
-                    padding: 8px 16px;
-                    background-color: #ECFDF5;
-                    border: 1px solid #A7F3D0;
-                    border-radius: 12px;
-                }
-            """)
-        elif "processing" in status.lower() or "listening" in status.lower():
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: #2563EB;
-                    padding: 8px 16px;
-                    background-color: #EFF6FF;
-                    border: 1px solid #BFDBFE;
-                    border-radius: 12px;
-                }
-            """)
-        else:
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: #374151;
-                    padding: 8px 16px;
-                    background-color: #F3F4F6;
-                    border-radius: 12px;
-                }
-            """)
-    
+
+        # Pick the style variant for this status type: one casefold,
+        # one pass over the category table
+        lowered = status.casefold()
+        key = "neutral"
+        for token, needles in _STATUS_CATEGORIES:
+            if any(needle in lowered for needle in needles):
+                key = token
+                break
+
+        # Swap the dynamic property and repolish only on a real change;
+        # the stylesheet itself is never re-set, so Qt's parsed rules
+        # stay cached
+        if self.status_label.property("state") != key:
+            self.status_label.setProperty("state", key)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
+
     def expand_window(self):
         """Expand window to show response area"""
         if self.height() == self.compact_height:
@@ -476,36 +626,56 @@ class MainWindow(QMainWindow):
     
     def handle_error(self, error: str):
         """Handle errors from speech recognition"""
-        print(f"❌ Speech recognition error: {error}")
+        log.error("❌ Speech recognition error: %s", error)
         self.update_status(f"Error: {error}")
         
         # Show error state on activity indicator
         self.activity_indicator.set_state("error")
-        
+
         # Return to listening state after error display
         QTimer.singleShot(3000, lambda: self.activity_indicator.set_state("listening"))
-        
-        # Show error dialog
-        QMessageBox.warning(self, "Error", f"Speech recognition error:\n{error}")
+
+        # Show a transient inline banner instead of a modal dialog: a
+        # QMessageBox here would spin a nested event loop and freeze
+        # signal processing while the speech thread is trying to recover
+        self.error_banner.setText(f"Speech recognition error: {error}")
+        self.error_banner.setVisible(True)
+        QTimer.singleShot(3000, self.error_banner.hide)
     
     def closeEvent(self, event):
         """Handle window close event"""
-        print("🔄 Shutting down...")
-        
-        # Stop speech recognition
-        self.stop_speech_recognition()
-        
+        log.debug("🔄 Shutting down...")
+
+        # Wake any in-flight playback wait so its worker exits now
+        # instead of sleeping out the remaining clip length
+        self._audio_stop.set()
+
         # Stop any ongoing audio playback
         if self.audio_available:
             try:
-                pygame.mixer.music.stop()
-                print("🔇 Audio playback stopped")
+                pygame.mixer.stop()
+                log.debug("🔇 Audio playback stopped")
             except Exception as e:
-                print(f"❌ Error stopping audio: {e}")
-        
-        # Force cleanup
-        if hasattr(self, 'speech_thread') and self.speech_thread:
-            self.speech_thread.terminate()
-            self.speech_thread.wait(2000)
-        
+                log.error("❌ Error stopping audio: %s", e)
+
+        # First pass with the speech thread still running: ask it to
+        # stop and finish closing when its finished signal fires,
+        # instead of freezing the GUI thread in wait()
+        if self.speech_thread and self.speech_thread.isRunning():
+            if not self._closing:
+                self._closing = True
+                self.speech_thread.finished.connect(self.close)
+                self.stop_speech_recognition()
+            event.ignore()
+            return
+
+        # Stop accepting audio work; don't block shutdown on in-flight clips
+        self._audio_executor.shutdown(wait=False, cancel_futures=True)
+
+        # Unblock the dispatch worker so it exits
+        self._command_queue.put(None)
+
+        # Close pooled backend connections
+        self.backend_service.close()
+
         event.accept()
\ No newline at end of file
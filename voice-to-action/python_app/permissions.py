@@ -9,6 +9,8 @@ Handles macOS permission requests and checks for:
 Author: AI Assistant
 """
 
+from functools import lru_cache
+
 try:
     from ApplicationServices import AXIsProcessTrusted
     MACOS_AVAILABLE = True
@@ -23,8 +25,10 @@ class PermissionManager:
     """Handles macOS permission requests and checks"""
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def check_accessibility_permissions() -> bool:
-        """Check if accessibility permissions are granted"""
+        """Check if accessibility permissions are granted (cached; the
+        AXIsProcessTrusted bridge call is constant within a session)"""
         if not MACOS_AVAILABLE:
             print("⚠️ macOS frameworks not available - skipping accessibility check")
             return True
@@ -40,8 +44,10 @@ class PermissionManager:
             return False
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def check_microphone_permissions() -> bool:
-        """Check microphone permissions"""
+        """Check microphone permissions (cached; sd.query_devices
+        enumerates Core Audio units, tens of ms on macOS)"""
         try:
             # Try to access microphone
             devices = sd.query_devices()
@@ -51,6 +57,13 @@ class PermissionManager:
             print("Please grant microphone permissions in System Preferences > Security & Privacy > Privacy > Microphone")
             return False
     
+    @staticmethod
+    def invalidate():
+        """Forget cached results, e.g. after the user was prompted to
+        grant permissions, so the next check reflects the new state"""
+        PermissionManager.check_accessibility_permissions.cache_clear()
+        PermissionManager.check_microphone_permissions.cache_clear()
+
     @staticmethod
     def request_all_permissions():
         """Request all necessary permissions"""
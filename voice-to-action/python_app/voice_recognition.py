@@ -13,7 +13,7 @@ import time
 import threading
 import re
 from typing import Optional
-from PySide6.QtCore import QThread, Signal, QObject
+from PySide6.QtCore import QThread, Signal, QObject, Qt
 
 # Gladia transcription imports
 try:
@@ -92,10 +92,16 @@ class SpeechRecognitionThread(QThread):
         try:
             self.gladia_transcriber = GladiaTranscription(os.getenv('GLADIA_API_KEY'))
             
-            # Connect signals for handling transcription results
-            self.gladia_transcriber.transcription_result.connect(self.on_final_transcription)
-            self.gladia_transcriber.transcription_partial.connect(self.on_partial_transcription)
-            self.gladia_transcriber.error_occurred.connect(self.on_transcription_error)
+            # Connect signals for handling transcription results. The
+            # transcriber emits from its asyncio loop thread, so queued
+            # connections avoid AutoConnection's per-emit resolution and
+            # keep delivery off the emitting thread during partial bursts
+            self.gladia_transcriber.transcription_result.connect(
+                self.on_final_transcription, Qt.QueuedConnection)
+            self.gladia_transcriber.transcription_partial.connect(
+                self.on_partial_transcription, Qt.QueuedConnection)
+            self.gladia_transcriber.error_occurred.connect(
+                self.on_transcription_error, Qt.QueuedConnection)
             
             print("✅ Gladia transcriber initialized")
             return True
@@ -267,6 +273,7 @@ class SpeechRecognitionThread(QThread):
         # Stop Gladia transcription
         if self.gladia_transcriber:
             self.gladia_transcriber.stop_transcription()
-            
-        # Give thread time to clean up
-        self.wait(2000)  # Wait up to 2 seconds
\ No newline at end of file
+
+        # No wait() here: the run loop notices running=False within
+        # ~100 ms and exits on its own; callers that need to know when
+        # shutdown is done observe the QThread finished signal
\ No newline at end of file